@@ -87,24 +87,68 @@ lux_chain_t* lux_chain_new(const lux_config_t* config);
 // Destroy a chain
 void lux_chain_destroy(lux_chain_t* chain);
 
+// Drop all blocks, votes and statistics so the chain can be reused.
+// Callbacks are kept. A non-NULL config replaces the current one.
+lux_error_t lux_chain_reset(lux_chain_t* chain, const lux_config_t* config);
+
 // Start the chain
 lux_error_t lux_chain_start(lux_chain_t* chain);
 
 // Stop the chain
 void lux_chain_stop(lux_chain_t* chain);
 
-// Add a new block to the chain
+// Add a new block to the chain. The block is undecided until beta confidence
+// votes accept it, which also rejects its siblings. Blocks whose parent is
+// unknown attach to the all-zero genesis block; re-adding a block is a no-op.
 lux_error_t lux_chain_add_block(
     lux_chain_t* chain,
     const lux_block_t* block
 );
 
+// Add a batch of blocks from struct-of-arrays buffers: ids and parent_ids
+// hold num_blocks packed 32-byte IDs. timestamps may be NULL to stamp every
+// block with the current time. Not atomic: on error the blocks before the
+// failing one stay inserted.
+lux_error_t lux_chain_add_blocks(
+    lux_chain_t* chain,
+    const uint8_t* ids,
+    const uint8_t* parent_ids,
+    const uint64_t* heights,
+    const uint64_t* timestamps,
+    size_t num_blocks
+);
+
 // Process a vote
 lux_error_t lux_consensus_process_vote(
     lux_chain_t* engine,
     const lux_vote_t* vote
 );
 
+// Process a batch of votes under a single lock acquisition, in order. Votes
+// for unknown blocks are skipped and reported as LUX_ERROR_INVALID_STATE after
+// the rest of the batch is applied. num_threads is accepted for compatibility
+// and ignored: a decision rejects sibling blocks and updates shared state, so
+// votes for different blocks cannot be applied independently.
+lux_error_t lux_consensus_process_votes_parallel(
+    lux_chain_t* engine,
+    const lux_vote_t* votes,
+    size_t num_votes,
+    uint32_t num_threads
+);
+
+// Process a batch of votes given as packed columns: voter_ids and block_ids
+// hold num_votes 32-byte IDs back to back, preferences one byte per vote
+// (non-zero for a preference vote). The engine lock is taken once for the
+// whole batch; votes for unknown blocks are skipped and reported as
+// LUX_ERROR_INVALID_STATE.
+lux_error_t lux_consensus_process_votes_batch(
+    lux_chain_t* engine,
+    const uint8_t* voter_ids,
+    const uint8_t* block_ids,
+    const uint8_t* preferences,
+    size_t num_votes
+);
+
 // Check if a block is accepted
 lux_error_t lux_consensus_is_accepted(
     lux_chain_t* engine,
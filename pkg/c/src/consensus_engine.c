@@ -111,6 +111,37 @@ static lux_error_t add_block_to_table(lux_chain_t* engine, block_node_t* node) {
     return LUX_SUCCESS;
 }
 
+// Append node to parent's children, growing the array as needed
+static lux_error_t link_child(block_node_t* parent, block_node_t* node) {
+    if (parent->children_count >= parent->children_capacity) {
+        size_t new_capacity;
+        if (parent->children_capacity == 0) {
+            new_capacity = 4;
+        } else {
+            // [C-009] Check for overflow before doubling capacity
+            if (parent->children_capacity > SIZE_MAX / 2) {
+                return LUX_ERROR_OUT_OF_MEMORY;
+            }
+            new_capacity = parent->children_capacity * 2;
+        }
+        // [C-009] Also check that the total allocation size won't overflow
+        if (new_capacity > SIZE_MAX / sizeof(block_node_t*)) {
+            return LUX_ERROR_OUT_OF_MEMORY;
+        }
+        block_node_t** new_children = (block_node_t**)realloc(
+            parent->children,
+            new_capacity * sizeof(block_node_t*)
+        );
+        if (!new_children) {
+            return LUX_ERROR_OUT_OF_MEMORY;
+        }
+        parent->children = new_children;
+        parent->children_capacity = new_capacity;
+    }
+    parent->children[parent->children_count++] = node;
+    return LUX_SUCCESS;
+}
+
 // Lux Consensus algorithm implementation
 static bool check_confidence(lux_chain_t* engine, block_node_t* node) {
     return node->confidence_count >= engine->config.alpha;
@@ -132,6 +163,7 @@ static void process_decision(lux_chain_t* engine, block_node_t* node) {
     
     if (check_decision_threshold(engine, node)) {
         node->is_accepted = true;
+        node->is_processing = false;
         engine->stats.blocks_accepted++;
         
         // Update preferred block
@@ -143,10 +175,14 @@ static void process_decision(lux_chain_t* engine, block_node_t* node) {
         }
         
         // Reject conflicting blocks
+        if (!node->parent) {
+            return;
+        }
         for (size_t i = 0; i < node->parent->children_count; i++) {
             block_node_t* sibling = node->parent->children[i];
             if (sibling != node && !sibling->is_rejected) {
                 sibling->is_rejected = true;
+                sibling->is_processing = false;
                 engine->stats.blocks_rejected++;
             }
         }
@@ -287,41 +323,12 @@ lux_error_t lux_consensus_add_block(
     }
     
     // Add to parent's children
-    if (node->parent->children_count >= node->parent->children_capacity) {
-        size_t new_capacity;
-        if (node->parent->children_capacity == 0) {
-            new_capacity = 4;
-        } else {
-            // [C-009] Check for overflow before doubling capacity
-            if (node->parent->children_capacity > SIZE_MAX / 2) {
-                free(node->block.data);
-                free(node);
-                pthread_mutex_unlock(&engine->mutex);
-                return LUX_ERROR_OUT_OF_MEMORY;
-            }
-            new_capacity = node->parent->children_capacity * 2;
-        }
-        // [C-009] Also check that the total allocation size won't overflow
-        if (new_capacity > SIZE_MAX / sizeof(block_node_t*)) {
-            free(node->block.data);
-            free(node);
-            pthread_mutex_unlock(&engine->mutex);
-            return LUX_ERROR_OUT_OF_MEMORY;
-        }
-        block_node_t** new_children = (block_node_t**)realloc(
-            node->parent->children,
-            new_capacity * sizeof(block_node_t*)
-        );
-        if (!new_children) {
-            free(node->block.data);
-            free(node);
-            pthread_mutex_unlock(&engine->mutex);
-            return LUX_ERROR_OUT_OF_MEMORY;
-        }
-        node->parent->children = new_children;
-        node->parent->children_capacity = new_capacity;
+    if (link_child(node->parent, node) != LUX_SUCCESS) {
+        free(node->block.data);
+        free(node);
+        pthread_mutex_unlock(&engine->mutex);
+        return LUX_ERROR_OUT_OF_MEMORY;
     }
-    node->parent->children[node->parent->children_count++] = node;
     
     // Add to hash table
     lux_error_t err = add_block_to_table(engine, node);
@@ -337,6 +344,54 @@ lux_error_t lux_consensus_add_block(
 }
 
 // Vote processing
+
+// Cache a vote for analytics. Caller must hold engine->mutex.
+static void cache_vote_locked(lux_chain_t* engine, const lux_vote_t* vote) {
+    vote_cache_t* cached_vote = (vote_cache_t*)malloc(sizeof(vote_cache_t));
+    if (!cached_vote) {
+        return;
+    }
+
+    memcpy(cached_vote->voter_id, vote->voter_id, 32);
+    memcpy(cached_vote->block_id, vote->block_id, 32);
+    cached_vote->timestamp = (uint64_t)time(NULL);
+    cached_vote->next = engine->vote_cache;
+    engine->vote_cache = cached_vote;
+    engine->vote_cache_size++;
+
+    // [C-007] Evict 10% of cache when over limit to prevent DoS via unbounded growth.
+    // Previous code evicted only 1 entry (O(n) traversal per vote, negligible eviction).
+    if (engine->vote_cache_size > 10000) {
+        size_t evict_count = engine->vote_cache_size / 10; // 10%
+        if (evict_count == 0) evict_count = 1;
+
+        // Walk to the node just before the eviction tail
+        vote_cache_t* cursor = engine->vote_cache;
+        size_t keep_count = engine->vote_cache_size - evict_count;
+        for (size_t i = 1; i < keep_count && cursor->next; i++) {
+            cursor = cursor->next;
+        }
+
+        // Free the tail (oldest entries)
+        vote_cache_t* tail = cursor->next;
+        cursor->next = NULL;
+        while (tail) {
+            vote_cache_t* next = tail->next;
+            free(tail);
+            tail = next;
+        }
+        engine->vote_cache_size = keep_count;
+    }
+}
+
+// Update a block's vote counters. Branchless: vote kinds arrive in no
+// particular order, so a conditional here mispredicts about half the time.
+static inline void count_vote(block_node_t* node, bool is_preference) {
+    uint64_t pref = (uint64_t)is_preference;
+    node->preference_count += pref;
+    node->confidence_count += pref ^ 1;
+}
+
 lux_error_t lux_consensus_process_vote(
     lux_chain_t* engine,
     const lux_vote_t* vote
@@ -354,46 +409,10 @@ lux_error_t lux_consensus_process_vote(
     }
     
     // Update vote counts
-    if (vote->is_preference) {
-        node->preference_count++;
-    } else {
-        node->confidence_count++;
-    }
+    count_vote(node, vote->is_preference);
     
     // Cache vote for analytics
-    vote_cache_t* cached_vote = (vote_cache_t*)malloc(sizeof(vote_cache_t));
-    if (cached_vote) {
-        memcpy(cached_vote->voter_id, vote->voter_id, 32);
-        memcpy(cached_vote->block_id, vote->block_id, 32);
-        cached_vote->timestamp = (uint64_t)time(NULL);
-        cached_vote->next = engine->vote_cache;
-        engine->vote_cache = cached_vote;
-        engine->vote_cache_size++;
-        
-        // [C-007] Evict 10% of cache when over limit to prevent DoS via unbounded growth.
-        // Previous code evicted only 1 entry (O(n) traversal per vote, negligible eviction).
-        if (engine->vote_cache_size > 10000) {
-            size_t evict_count = engine->vote_cache_size / 10; // 10%
-            if (evict_count == 0) evict_count = 1;
-
-            // Walk to the node just before the eviction tail
-            vote_cache_t* cursor = engine->vote_cache;
-            size_t keep_count = engine->vote_cache_size - evict_count;
-            for (size_t i = 1; i < keep_count && cursor->next; i++) {
-                cursor = cursor->next;
-            }
-
-            // Free the tail (oldest entries)
-            vote_cache_t* tail = cursor->next;
-            cursor->next = NULL;
-            while (tail) {
-                vote_cache_t* next = tail->next;
-                free(tail);
-                tail = next;
-            }
-            engine->vote_cache_size = keep_count;
-        }
-    }
+    cache_vote_locked(engine, vote);
     
     engine->stats.votes_processed++;
     
@@ -404,6 +423,83 @@ lux_error_t lux_consensus_process_vote(
     return LUX_SUCCESS;
 }
 
+lux_error_t lux_consensus_process_votes_parallel(
+    lux_chain_t* engine,
+    const lux_vote_t* votes,
+    size_t num_votes,
+    uint32_t num_threads
+) {
+    if (!engine || (!votes && num_votes > 0)) {
+        return LUX_ERROR_INVALID_PARAMS;
+    }
+    // Accepting a block rejects its siblings and moves the shared preference
+    // and stats, so votes are not independent per block. Applying the batch
+    // under one lock beats spawning workers that would serialize on it.
+    (void)num_threads;
+
+    bool missing = false;
+
+    pthread_mutex_lock(&engine->mutex);
+
+    for (size_t i = 0; i < num_votes; i++) {
+        block_node_t* node = find_block(engine, votes[i].block_id);
+        if (!node) {
+            missing = true;
+            continue;
+        }
+
+        count_vote(node, votes[i].is_preference);
+        cache_vote_locked(engine, &votes[i]);
+        engine->stats.votes_processed++;
+        process_decision(engine, node);
+    }
+
+    pthread_mutex_unlock(&engine->mutex);
+
+    // Votes for unknown blocks are skipped; the rest of the batch is applied
+    return missing ? LUX_ERROR_INVALID_STATE : LUX_SUCCESS;
+}
+
+lux_error_t lux_consensus_process_votes_batch(
+    lux_chain_t* engine,
+    const uint8_t* voter_ids,
+    const uint8_t* block_ids,
+    const uint8_t* preferences,
+    size_t num_votes
+) {
+    if (!engine || (num_votes > 0 && (!voter_ids || !block_ids || !preferences))) {
+        return LUX_ERROR_INVALID_PARAMS;
+    }
+
+    bool missing = false;
+    lux_vote_t vote;
+
+    pthread_mutex_lock(&engine->mutex);
+
+    for (size_t i = 0; i < num_votes; i++) {
+        const uint8_t* block_id = block_ids + i * 32;
+        block_node_t* node = find_block(engine, block_id);
+        if (!node) {
+            missing = true;
+            continue;
+        }
+
+        memcpy(vote.voter_id, voter_ids + i * 32, 32);
+        memcpy(vote.block_id, block_id, 32);
+        vote.is_preference = preferences[i] != 0;
+
+        count_vote(node, vote.is_preference);
+        cache_vote_locked(engine, &vote);
+        engine->stats.votes_processed++;
+        process_decision(engine, node);
+    }
+
+    pthread_mutex_unlock(&engine->mutex);
+
+    // Votes for unknown blocks are skipped; the rest of the batch is applied
+    return missing ? LUX_ERROR_INVALID_STATE : LUX_SUCCESS;
+}
+
 // Query operations
 lux_error_t lux_consensus_is_accepted(
     lux_chain_t* engine,
@@ -564,6 +660,20 @@ const char* lux_error_string(lux_error_t error) {
     }
 }
 
+// Engine type names, indexed by lux_engine_type_t
+static const char* const engine_type_names[] = {
+    [LUX_ENGINE_CHAIN] = "Chain",
+    [LUX_ENGINE_DAG] = "DAG",
+    [LUX_ENGINE_PQ] = "PQ",
+};
+
+const char* lux_engine_type_string(lux_engine_type_t type) {
+    if ((unsigned)type >= sizeof(engine_type_names) / sizeof(engine_type_names[0])) {
+        return "Unknown";
+    }
+    return engine_type_names[type];
+}
+
 // New v1.22.0 simplified API functions
 
 lux_chain_t* lux_chain_new_default(void) {
@@ -576,6 +686,56 @@ lux_chain_t* lux_chain_new_default(void) {
     return lux_chain_new(&config);
 }
 
+// Copy config and set auto-calculated parameters
+static void apply_config(lux_chain_t* chain, const lux_config_t* config) {
+    chain->config.node_count = config->node_count;
+    chain->config.k = config->k > 0 ? config->k : (config->node_count > 1 ? config->node_count / 2 : 1);
+    chain->config.alpha = config->alpha > 0 ? config->alpha : (config->node_count > 1 ? (config->node_count * 2) / 3 : 1);
+    chain->config.beta = config->beta > 0 ? config->beta : (config->node_count > 2 ? config->node_count - 2 : 1);
+}
+
+// Free every block and cached vote; leaves dangling pointers for the caller to clear
+static void free_chain_state(lux_chain_t* chain) {
+    for (size_t i = 0; i < HASH_TABLE_SIZE; i++) {
+        hash_entry_t* entry = chain->block_table[i];
+        while (entry) {
+            hash_entry_t* next = entry->next;
+            if (entry->node) {
+                free(entry->node->children);
+                free(entry->node);
+            }
+            free(entry);
+            entry = next;
+        }
+    }
+
+    vote_cache_t* vote = chain->vote_cache;
+    while (vote) {
+        vote_cache_t* next = vote->next;
+        free(vote);
+        vote = next;
+    }
+}
+
+// Insert the accepted all-zero genesis block that parentless blocks hang off.
+// Caller must hold the chain's locks or own it exclusively.
+static lux_error_t add_genesis_locked(lux_chain_t* chain) {
+    block_node_t* genesis = (block_node_t*)calloc(1, sizeof(block_node_t));
+    if (!genesis) {
+        return LUX_ERROR_OUT_OF_MEMORY;
+    }
+    genesis->is_accepted = true;
+
+    lux_error_t err = add_block_to_table(chain, genesis);
+    if (err != LUX_SUCCESS) {
+        free(genesis);
+        return err;
+    }
+    chain->genesis_block = genesis;
+    chain->preferred_block = genesis;
+    return LUX_SUCCESS;
+}
+
 lux_chain_t* lux_chain_new(const lux_config_t* config) {
     if (!config) {
         return NULL;
@@ -586,11 +746,7 @@ lux_chain_t* lux_chain_new(const lux_config_t* config) {
         return NULL;
     }
     
-    // Copy config and set auto-calculated parameters
-    chain->config.node_count = config->node_count;
-    chain->config.k = config->k > 0 ? config->k : (config->node_count > 1 ? config->node_count / 2 : 1);
-    chain->config.alpha = config->alpha > 0 ? config->alpha : (config->node_count > 1 ? (config->node_count * 2) / 3 : 1);
-    chain->config.beta = config->beta > 0 ? config->beta : (config->node_count > 2 ? config->node_count - 2 : 1);
+    apply_config(chain, config);
     
     // Initialize mutexes
     pthread_mutex_init(&chain->mutex, NULL);
@@ -599,6 +755,10 @@ lux_chain_t* lux_chain_new(const lux_config_t* config) {
     chain->start_time = (uint64_t)time(NULL);
     
     // Note: block_table is already a static array in the struct, not allocated
+    if (add_genesis_locked(chain) != LUX_SUCCESS) {
+        lux_chain_destroy(chain);
+        return NULL;
+    }
     
     return chain;
 }
@@ -608,27 +768,7 @@ void lux_chain_destroy(lux_chain_t* chain) {
         return;
     }
     
-    // Free blocks in table
-    for (size_t i = 0; i < HASH_TABLE_SIZE; i++) {
-        hash_entry_t* entry = chain->block_table[i];
-        while (entry) {
-            hash_entry_t* next = entry->next;
-            if (entry->node) {
-                free(entry->node->children);
-                free(entry->node);
-            }
-            free(entry);
-            entry = next;
-        }
-    }
-    
-    // Free vote cache
-    vote_cache_t* vote = chain->vote_cache;
-    while (vote) {
-        vote_cache_t* next = vote->next;
-        free(vote);
-        vote = next;
-    }
+    free_chain_state(chain);
     
     // Destroy mutexes
     pthread_mutex_destroy(&chain->mutex);
@@ -637,6 +777,33 @@ void lux_chain_destroy(lux_chain_t* chain) {
     free(chain);
 }
 
+lux_error_t lux_chain_reset(lux_chain_t* chain, const lux_config_t* config) {
+    if (!chain) {
+        return LUX_ERROR_INVALID_PARAMS;
+    }
+
+    pthread_mutex_lock(&chain->mutex);
+    pthread_rwlock_wrlock(&chain->rwlock);
+
+    free_chain_state(chain);
+    memset(chain->block_table, 0, sizeof(chain->block_table));
+    chain->genesis_block = NULL;
+    chain->preferred_block = NULL;
+    chain->vote_cache = NULL;
+    chain->vote_cache_size = 0;
+    memset(&chain->stats, 0, sizeof(chain->stats));
+
+    if (config) {
+        apply_config(chain, config);
+    }
+    chain->start_time = (uint64_t)time(NULL);
+    lux_error_t err = add_genesis_locked(chain);
+
+    pthread_rwlock_unlock(&chain->rwlock);
+    pthread_mutex_unlock(&chain->mutex);
+    return err;
+}
+
 lux_error_t lux_chain_start(lux_chain_t* chain) {
     if (!chain) {
         return LUX_ERROR_INVALID_PARAMS;
@@ -665,31 +832,79 @@ lux_error_t lux_chain_add_block(lux_chain_t* chain, const lux_block_t* block) {
         return LUX_ERROR_OUT_OF_MEMORY;
     }
     
-    // Copy block data
+    // Copy block data. The block stays undecided until votes carry it past
+    // beta in process_decision, which also rejects its siblings.
     memcpy(&node->block, block, sizeof(lux_block_t));
     node->is_processing = true;
     
-    // Add to hash table
-    lux_error_t err = add_block_to_table(chain, node);
-    if (err != LUX_SUCCESS) {
+    // Insert under both locks: voters look blocks up under the mutex and
+    // queries under the rwlock
+    pthread_mutex_lock(&chain->mutex);
+    pthread_rwlock_wrlock(&chain->rwlock);
+
+    // Re-adding a known block is a no-op
+    if (find_block(chain, block->id)) {
+        pthread_rwlock_unlock(&chain->rwlock);
+        pthread_mutex_unlock(&chain->mutex);
         free(node);
-        return err;
+        return LUX_SUCCESS;
     }
-    
-    // Update stats
-    pthread_rwlock_wrlock(&chain->rwlock);
-    chain->stats.votes_processed++;
-    chain->stats.blocks_accepted++;
+
+    // Unknown parents attach to genesis
+    node->parent = find_block(chain, block->parent_id);
+    if (!node->parent) {
+        node->parent = chain->genesis_block;
+    }
+
+    lux_error_t err = LUX_SUCCESS;
+    if (node->parent) {
+        err = link_child(node->parent, node);
+    }
+    if (err == LUX_SUCCESS) {
+        err = add_block_to_table(chain, node);
+        if (err != LUX_SUCCESS && node->parent) {
+            node->parent->children_count--;
+        }
+    }
+
     pthread_rwlock_unlock(&chain->rwlock);
-    
-    // Mark as accepted (simplified consensus)
-    node->is_accepted = true;
-    node->is_processing = false;
-    
-    // Trigger callback if set
-    if (chain->decision_callback) {
-        chain->decision_callback(block->id, chain->callback_user_data);
+    pthread_mutex_unlock(&chain->mutex);
+
+    if (err != LUX_SUCCESS) {
+        free(node);
     }
-    
+    return err;
+}
+
+lux_error_t lux_chain_add_blocks(
+    lux_chain_t* chain,
+    const uint8_t* ids,
+    const uint8_t* parent_ids,
+    const uint64_t* heights,
+    const uint64_t* timestamps,
+    size_t num_blocks
+) {
+    if (!chain || (num_blocks > 0 && (!ids || !parent_ids || !heights))) {
+        return LUX_ERROR_INVALID_PARAMS;
+    }
+
+    uint64_t now = (uint64_t)time(NULL);
+    lux_block_t block;
+    memset(&block, 0, sizeof(block));
+
+    // Walk the packed columns sequentially so each ID read stays on
+    // contiguous cache lines
+    for (size_t i = 0; i < num_blocks; i++) {
+        memcpy(block.id, ids + i * 32, 32);
+        memcpy(block.parent_id, parent_ids + i * 32, 32);
+        block.height = heights[i];
+        block.timestamp = timestamps ? timestamps[i] : now;
+
+        lux_error_t err = lux_chain_add_block(chain, &block);
+        if (err != LUX_SUCCESS) {
+            return err;
+        }
+    }
+
     return LUX_SUCCESS;
 }
@@ -89,9 +89,104 @@ int main(void) {
     
     err = lux_chain_start(custom_chain);
     ASSERT_TEST(err == LUX_SUCCESS, "Start custom chain");
-    
-    // Test 6: Cleanup
-    printf("\n%s--- Test 6: Cleanup ---%s\n", COLOR_YELLOW, COLOR_RESET);
+
+    ASSERT_TEST(strcmp(lux_engine_type_string(LUX_ENGINE_DAG), "DAG") == 0, "Engine type name");
+    ASSERT_TEST(strcmp(lux_engine_type_string((lux_engine_type_t)99), "Unknown") == 0,
+                "Unknown engine type name");
+
+    // Test 6: Batched block insert
+    printf("\n%s--- Test 6: Batched Blocks ---%s\n", COLOR_YELLOW, COLOR_RESET);
+    uint8_t batch_ids[8 * 32];
+    uint8_t batch_parents[8 * 32];
+    uint64_t batch_heights[8];
+    memset(batch_ids, 0, sizeof(batch_ids));
+    memset(batch_parents, 0, sizeof(batch_parents));
+    for (int i = 0; i < 8; i++) {
+        batch_ids[i * 32] = (uint8_t)(0x10 + i);
+        batch_heights[i] = 1;
+    }
+
+    err = lux_chain_add_blocks(custom_chain, batch_ids, batch_parents, batch_heights, NULL, 8);
+    ASSERT_TEST(err == LUX_SUCCESS, "Add 8 blocks in one call");
+
+    bool batch_accepted = false;
+    err = lux_consensus_is_accepted(custom_chain, &batch_ids[7 * 32], &batch_accepted);
+    ASSERT_TEST(err == LUX_SUCCESS, "Find last batched block");
+    ASSERT_TEST(!batch_accepted, "Batched blocks start undecided");
+
+    // Test 7: Vote array processing
+    printf("\n%s--- Test 7: Parallel Votes ---%s\n", COLOR_YELLOW, COLOR_RESET);
+    lux_consensus_stats_t before, after;
+    lux_consensus_get_stats(custom_chain, &before);
+
+    lux_vote_t votes[64];
+    memset(votes, 0, sizeof(votes));
+    for (int i = 0; i < 64; i++) {
+        votes[i].voter_id[0] = (uint8_t)i;
+        votes[i].block_id[0] = (uint8_t)(0x10 + (i % 8));
+        votes[i].is_preference = (i % 2 == 0);
+    }
+
+    err = lux_consensus_process_votes_parallel(custom_chain, votes, 64, 4);
+    ASSERT_TEST(err == LUX_SUCCESS, "Process 64 votes in one call");
+
+    lux_consensus_get_stats(custom_chain, &after);
+    ASSERT_TEST(after.votes_processed - before.votes_processed == 64,
+                "All parallel votes counted");
+
+    // Block 0x11 gets only confidence votes and reaches beta first; its
+    // siblings under genesis are rejected
+    lux_consensus_is_accepted(custom_chain, &batch_ids[1 * 32], &batch_accepted);
+    ASSERT_TEST(batch_accepted, "Block accepted after beta confidence votes");
+    lux_consensus_is_accepted(custom_chain, &batch_ids[0], &batch_accepted);
+    ASSERT_TEST(!batch_accepted && after.blocks_accepted == 1 && after.blocks_rejected == 7,
+                "Siblings of the accepted block rejected");
+
+    votes[0].block_id[0] = 0xEE;  // Unknown block
+    err = lux_consensus_process_votes_parallel(custom_chain, votes, 64, 4);
+    ASSERT_TEST(err == LUX_ERROR_INVALID_STATE, "Report votes for unknown blocks");
+
+    // Test 8: Batched votes from packed columns
+    printf("\n%s--- Test 8: Batched Votes ---%s\n", COLOR_YELLOW, COLOR_RESET);
+    uint8_t batch_voters[16 * 32];
+    uint8_t batch_targets[16 * 32];
+    uint8_t batch_prefs[16];
+    memset(batch_voters, 0, sizeof(batch_voters));
+    memset(batch_targets, 0, sizeof(batch_targets));
+    for (int i = 0; i < 16; i++) {
+        batch_voters[i * 32] = (uint8_t)i;
+        batch_targets[i * 32] = (uint8_t)(0x10 + (i % 8));
+        batch_prefs[i] = (uint8_t)(i % 2);
+    }
+
+    lux_consensus_get_stats(custom_chain, &before);
+    err = lux_consensus_process_votes_batch(custom_chain, batch_voters, batch_targets, batch_prefs, 16);
+    ASSERT_TEST(err == LUX_SUCCESS, "Process 16 votes in one call");
+
+    lux_consensus_get_stats(custom_chain, &after);
+    ASSERT_TEST(after.votes_processed - before.votes_processed == 16,
+                "All batched votes counted");
+
+    batch_targets[0] = 0xEE;  // Unknown block
+    err = lux_consensus_process_votes_batch(custom_chain, batch_voters, batch_targets, batch_prefs, 16);
+    ASSERT_TEST(err == LUX_ERROR_INVALID_STATE, "Report batched votes for unknown blocks");
+
+    // Test 9: Reset
+    printf("\n%s--- Test 9: Reset ---%s\n", COLOR_YELLOW, COLOR_RESET);
+    err = lux_chain_reset(custom_chain, NULL);
+    ASSERT_TEST(err == LUX_SUCCESS, "Reset custom chain");
+
+    lux_consensus_get_stats(custom_chain, &after);
+    ASSERT_TEST(after.votes_processed == 0 && after.blocks_accepted == 0, "Reset clears stats");
+
+    err = lux_consensus_is_accepted(custom_chain, &batch_ids[0], &batch_accepted);
+    ASSERT_TEST(err == LUX_ERROR_INVALID_STATE, "Reset drops blocks");
+
+    err = lux_chain_add_blocks(custom_chain, batch_ids, batch_parents, batch_heights, NULL, 8);
+    ASSERT_TEST(err == LUX_SUCCESS, "Reuse chain after reset");
+
+    // Test 10: Cleanup
+    printf("\n%s--- Test 10: Cleanup ---%s\n", COLOR_YELLOW, COLOR_RESET);
     lux_chain_stop(chain);
     lux_chain_destroy(chain);
     ASSERT_TEST(1, "Stop and destroy first chain");
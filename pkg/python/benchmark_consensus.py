@@ -6,7 +6,7 @@ import time
 import statistics
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from lux_consensus import (
+from lux_consensus.engine import (
     ConsensusEngine, ConsensusConfig, Block, Vote,
     EngineType, ConsensusError
 )
@@ -25,14 +25,14 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from lux_consensus import (
+    from lux_consensus.engine import (
         ConsensusEngine, ConsensusConfig, Block, Vote,
         EngineType, ConsensusError
     )
 except ImportError as e:
     print(f"Warning: Could not import lux_consensus: {e}")
     print("Attempting to import from current directory...")
-    from lux_consensus import (
+    from lux_consensus.engine import (
         ConsensusEngine, ConsensusConfig, Block, Vote,
         EngineType, ConsensusError
     )
@@ -408,7 +408,7 @@ class CPUBenchmark:
 
         # Setup code
         setup = """
-from lux_consensus import ConsensusEngine, ConsensusConfig, Block, Vote, EngineType
+from lux_consensus.engine import ConsensusEngine, ConsensusConfig, Block, Vote, EngineType
 import hashlib
 config = ConsensusConfig(
     k=20, alpha_preference=15, alpha_confidence=15, beta=20,
@@ -0,0 +1,19 @@
+# Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
+# See the file LICENSE for licensing terms.
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def _shared_dag_engine():
+    """One standard DAG engine built once per module"""
+    from lux_consensus.engine import ConsensusEngine, ConsensusConfig
+
+    return ConsensusEngine(ConsensusConfig(k=20, alpha=15, beta=20))
+
+
+@pytest.fixture
+def dag_engine(_shared_dag_engine):
+    """The module's DAG engine, reset so each test starts from a clean state"""
+    _shared_dag_engine.reset()
+    return _shared_dag_engine
@@ -30,7 +30,7 @@ __all__ = [
     'default_config', 'new_chain', 'new_block', 'new_vote', 'quick_start',
     'single_node_config', 'agent_mesh_config', 'blockchain_config',
     # Identity functions
-    'derive_voter_id', 'voter_id_from_agent', 'voter_id_from_public_key',
+    'derive_voter_id', 'derive_voter_ids_batch', 'derive_voter_id_fast', 'voter_id_from_agent', 'voter_id_from_public_key',
     # Bridge functions (AI consensus -> blockchain)
     'hanzo_result_to_vote', 'hanzo_state_to_certificate', 'create_ai_candidate',
     # Errors
@@ -45,7 +45,7 @@ from .types import (
     PolicyID, ValidatorSet, Validator,
     SequencerConfig, SequencerIdentity, RecursiveNetwork,
     single_node_config, agent_mesh_config, blockchain_config,
-    derive_voter_id, voter_id_from_agent, voter_id_from_public_key,
+    derive_voter_id, derive_voter_ids_batch, derive_voter_id_fast, voter_id_from_agent, voter_id_from_public_key,
     hanzo_result_to_vote, hanzo_state_to_certificate, create_ai_candidate,
 )
 
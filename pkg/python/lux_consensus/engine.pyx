@@ -0,0 +1,704 @@
+# Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
+# See the file LICENSE for licensing terms.
+
+# distutils: language = c
+# cython: language_level = 3
+
+from libc.stdint cimport uint8_t, uint32_t, uint64_t
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memset
+from cpython.bytes cimport PyBytes_AsString, PyBytes_Size
+import asyncio
+import queue
+import threading
+import time
+import weakref
+import numpy as np
+
+# Most votes the submit_vote_nowait consumer applies per native call
+VOTE_DRAIN_BATCH = 1024
+
+# C API declarations matching lux_consensus.h
+cdef extern from "lux_consensus.h":
+    # Error codes
+    ctypedef enum lux_error_t:
+        LUX_SUCCESS = 0
+        LUX_ERROR_INVALID_PARAMS = -1
+        LUX_ERROR_OUT_OF_MEMORY = -2
+        LUX_ERROR_INVALID_STATE = -3
+        LUX_ERROR_CONSENSUS_FAILED = -4
+        LUX_ERROR_NOT_IMPLEMENTED = -5
+
+    # Engine types
+    ctypedef enum lux_engine_type_t:
+        LUX_ENGINE_CHAIN = 0
+        LUX_ENGINE_DAG = 1
+        LUX_ENGINE_PQ = 2
+
+    # Configuration structure
+    ctypedef struct lux_config_t:
+        uint32_t node_count
+        uint32_t k
+        uint32_t alpha
+        uint32_t beta
+
+    # Block structure
+    ctypedef struct lux_block_t:
+        uint8_t id[32]
+        uint8_t parent_id[32]
+        uint64_t height
+        uint64_t timestamp
+        void* data
+        size_t data_size
+
+    # Vote structure
+    ctypedef struct lux_vote_t:
+        uint8_t voter_id[32]
+        uint8_t block_id[32]
+        bint is_preference
+
+    # Statistics structure
+    ctypedef struct lux_consensus_stats_t:
+        uint64_t blocks_accepted
+        uint64_t blocks_rejected
+        uint64_t polls_completed
+        uint64_t votes_processed
+        double average_decision_time_ms
+
+    # Opaque chain type
+    ctypedef struct lux_chain_t:
+        pass
+
+    # API functions
+    lux_error_t lux_consensus_init()
+    lux_error_t lux_consensus_cleanup()
+
+    lux_chain_t* lux_chain_new_default()
+    lux_chain_t* lux_chain_new(const lux_config_t* config)
+    void lux_chain_destroy(lux_chain_t* chain)
+
+    lux_error_t lux_chain_start(lux_chain_t* chain)
+    void lux_chain_stop(lux_chain_t* chain)
+
+    lux_error_t lux_chain_add_block(
+        lux_chain_t* chain,
+        const lux_block_t* block
+    )
+
+    lux_error_t lux_chain_reset(lux_chain_t* chain, const lux_config_t* config)
+
+    lux_error_t lux_chain_add_blocks(
+        lux_chain_t* chain,
+        const uint8_t* ids,
+        const uint8_t* parent_ids,
+        const uint64_t* heights,
+        const uint64_t* timestamps,
+        size_t num_blocks
+    )
+
+    lux_error_t lux_consensus_process_vote(
+        lux_chain_t* engine,
+        const lux_vote_t* vote
+    ) nogil
+
+    lux_error_t lux_consensus_process_votes_parallel(
+        lux_chain_t* engine,
+        const lux_vote_t* votes,
+        size_t num_votes,
+        uint32_t num_threads
+    ) nogil
+
+    lux_error_t lux_consensus_process_votes_batch(
+        lux_chain_t* engine,
+        const uint8_t* voter_ids,
+        const uint8_t* block_ids,
+        const uint8_t* preferences,
+        size_t num_votes
+    ) nogil
+
+    lux_error_t lux_consensus_is_accepted(
+        lux_chain_t* engine,
+        const uint8_t* block_id,
+        bint* is_accepted
+    )
+
+    lux_error_t lux_consensus_get_preference(
+        lux_chain_t* engine,
+        uint8_t* block_id
+    )
+
+    lux_error_t lux_consensus_poll(
+        lux_chain_t* engine,
+        uint32_t num_validators,
+        const uint8_t** validator_ids
+    ) nogil
+
+    lux_error_t lux_consensus_get_stats(
+        lux_chain_t* engine,
+        lux_consensus_stats_t* stats
+    )
+
+    const char* lux_error_string(lux_error_t error)
+    const char* lux_engine_type_string(lux_engine_type_t type)
+
+# Python exception for consensus errors
+class ConsensusError(Exception):
+    """Exception raised for consensus engine errors"""
+    pass
+
+# Engine type enum
+class EngineType:
+    CHAIN = LUX_ENGINE_CHAIN
+    DAG = LUX_ENGINE_DAG
+    PQ = LUX_ENGINE_PQ
+
+# Engine type names indexed by EngineType, read from the C table once at import
+_ENGINE_TYPE_STRINGS = tuple(
+    lux_engine_type_string(<lux_engine_type_t>t).decode()
+    for t in (LUX_ENGINE_CHAIN, LUX_ENGINE_DAG, LUX_ENGINE_PQ)
+)
+
+# Packed block record accepted by ConsensusEngine.add_blocks
+BLOCK_SOA_DTYPE = np.dtype({
+    'names': ['id', 'parent', 'height', 'ts'],
+    'formats': ['(32,)u1', '(32,)u1', 'u8', 'u8'],
+    'itemsize': 80,
+})
+
+# Python wrapper for consensus configuration
+cdef class ConsensusConfig:
+    """Configuration for consensus engine"""
+    cdef lux_config_t config
+
+    def __init__(self,
+                 node_count=100,
+                 k=20,
+                 alpha=15,
+                 beta=20):
+        self.config.node_count = node_count
+        self.config.k = k
+        self.config.alpha = alpha
+        self.config.beta = beta
+
+    @property
+    def node_count(self):
+        return self.config.node_count
+
+    @property
+    def k(self):
+        return self.config.k
+
+    @property
+    def alpha(self):
+        return self.config.alpha
+
+    @property
+    def beta(self):
+        return self.config.beta
+
+# Python wrapper for block
+cdef class Block:
+    """Block in the consensus engine"""
+    cdef lux_block_t block
+    cdef bytes _data
+
+    def __init__(self, block_id, parent_id, height, timestamp=None, data=None):
+        if len(block_id) != 32:
+            raise ValueError("block_id must be 32 bytes")
+        if len(parent_id) != 32:
+            raise ValueError("parent_id must be 32 bytes")
+
+        memcpy(self.block.id, PyBytes_AsString(block_id), 32)
+        memcpy(self.block.parent_id, PyBytes_AsString(parent_id), 32)
+        self.block.height = height
+        self.block.timestamp = timestamp if timestamp else int(time.time())
+
+        if data:
+            self._data = data
+            self.block.data = PyBytes_AsString(self._data)
+            self.block.data_size = PyBytes_Size(self._data)
+        else:
+            self.block.data = NULL
+            self.block.data_size = 0
+
+    @property
+    def id(self):
+        return bytes(self.block.id[:32])
+
+    @property
+    def parent_id(self):
+        return bytes(self.block.parent_id[:32])
+
+    @property
+    def height(self):
+        return self.block.height
+
+    @property
+    def timestamp(self):
+        return self.block.timestamp
+
+# Python wrapper for vote
+cdef class Vote:
+    """Vote in the consensus engine"""
+    cdef lux_vote_t vote
+
+    def __init__(self, voter_id, block_id, is_preference=False):
+        if len(voter_id) != 32:
+            raise ValueError("voter_id must be 32 bytes")
+        if len(block_id) != 32:
+            raise ValueError("block_id must be 32 bytes")
+
+        memcpy(self.vote.voter_id, PyBytes_AsString(voter_id), 32)
+        memcpy(self.vote.block_id, PyBytes_AsString(block_id), 32)
+        self.vote.is_preference = is_preference
+
+    @property
+    def voter_id(self):
+        return bytes(self.vote.voter_id[:32])
+
+    @property
+    def block_id(self):
+        return bytes(self.vote.block_id[:32])
+
+    @property
+    def is_preference(self):
+        return self.vote.is_preference
+
+# Python wrapper for statistics
+cdef class Stats:
+    """Statistics from the consensus engine"""
+    cdef lux_consensus_stats_t stats
+
+    @property
+    def blocks_accepted(self):
+        return self.stats.blocks_accepted
+
+    @property
+    def blocks_rejected(self):
+        return self.stats.blocks_rejected
+
+    @property
+    def polls_completed(self):
+        return self.stats.polls_completed
+
+    @property
+    def votes_processed(self):
+        return self.stats.votes_processed
+
+    @property
+    def average_decision_time_ms(self):
+        return self.stats.average_decision_time_ms
+
+    def __repr__(self):
+        return (f"Stats(blocks_accepted={self.blocks_accepted}, "
+                f"blocks_rejected={self.blocks_rejected}, "
+                f"polls_completed={self.polls_completed}, "
+                f"votes_processed={self.votes_processed}, "
+                f"average_decision_time_ms={self.average_decision_time_ms:.2f})")
+
+# Main consensus engine wrapper
+cdef class ConsensusEngine:
+    """Lux Consensus Engine"""
+    cdef lux_chain_t* chain
+    # get_stats() snapshot, valid while _cached_version == _stats_version
+    cdef uint64_t _stats_version
+    cdef uint64_t _cached_version
+    cdef Stats _stats_cache
+    # submit_vote_nowait() queue and its consumer thread (started on demand)
+    cdef object _vote_queue
+    cdef object _vote_consumer
+    cdef object _vote_consumer_lock
+    cdef list _vote_errors
+    # The vote consumer holds only a weak reference to the engine
+    cdef object __weakref__
+
+    def __init__(self, ConsensusConfig config=None):
+        cdef lux_error_t err
+
+        # Initialize library
+        err = lux_consensus_init()
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to initialize: {lux_error_string(err).decode()}")
+
+        # Create chain
+        if config is not None:
+            self.chain = lux_chain_new(&config.config)
+        else:
+            self.chain = lux_chain_new_default()
+
+        if self.chain == NULL:
+            raise ConsensusError("Failed to create chain")
+
+        self._vote_queue = queue.SimpleQueue()
+        self._vote_consumer_lock = threading.Lock()
+        self._vote_errors = []
+
+        # Start chain
+        err = lux_chain_start(self.chain)
+        if err != LUX_SUCCESS:
+            lux_chain_destroy(self.chain)
+            raise ConsensusError(f"Failed to start chain: {lux_error_string(err).decode()}")
+
+    def __dealloc__(self):
+        # Wake an idle vote consumer so its thread exits with the engine
+        if self._vote_consumer is not None:
+            self._vote_queue.put(None)
+        if self.chain != NULL:
+            lux_chain_stop(self.chain)
+            lux_chain_destroy(self.chain)
+            lux_consensus_cleanup()
+
+    def reset(self, ConsensusConfig config=None):
+        """Clear all blocks, votes and statistics, keeping the engine
+
+        Queued submit_vote_nowait() votes are applied first; their errors
+        are discarded, since the reset wipes their effects anyway. Pass a
+        config to reconfigure in place instead of building a new engine.
+        """
+        cdef lux_error_t err = LUX_SUCCESS
+        # Held throughout so no vote is submitted between the drain and the reset
+        with self._vote_consumer_lock:
+            self._stop_vote_consumer()
+            del self._vote_errors[:]
+            err = lux_chain_reset(self.chain, &config.config if config is not None else NULL)
+            self._stats_version += 1
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to reset: {lux_error_string(err).decode()}")
+
+    def add_block(self, Block block):
+        """Add a block to the consensus engine"""
+        cdef lux_error_t err = lux_chain_add_block(self.chain, &block.block)
+        self._stats_version += 1
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to add block: {lux_error_string(err).decode()}")
+
+    def add_blocks(self, blocks):
+        """Add a batch of blocks in a single call
+
+        Args:
+            blocks: NumPy array with dtype BLOCK_SOA_DTYPE
+
+        Not atomic; see add_blocks_soa.
+        """
+        if len(blocks) == 0:
+            return
+        # Split the records into contiguous columns for the C loop
+        self.add_blocks_soa(
+            np.ascontiguousarray(blocks['id']),
+            np.ascontiguousarray(blocks['parent']),
+            np.ascontiguousarray(blocks['height'], dtype=np.uint64),
+            np.ascontiguousarray(blocks['ts'], dtype=np.uint64),
+        )
+
+    def add_blocks_soa(self, const uint8_t[:, ::1] ids, const uint8_t[:, ::1] parent_ids,
+                       const uint64_t[::1] heights, const uint64_t[::1] timestamps=None):
+        """Add a batch of blocks from parallel columns in a single call
+
+        Args:
+            ids: (N, 32) uint8 block IDs
+            parent_ids: (N, 32) uint8 parent IDs
+            heights: (N,) uint64 heights
+            timestamps: optional (N,) uint64 timestamps; None stamps the
+                current time
+
+        lux_consensus.types.pack_candidates builds these columns from
+        wire Candidates.
+
+        Not atomic: the native loop stops at the first failing block and
+        the blocks before it stay inserted when ConsensusError is raised.
+        """
+        cdef size_t num_blocks = ids.shape[0]
+        if num_blocks == 0:
+            return
+        if ids.shape[1] != 32 or parent_ids.shape[1] != 32:
+            raise ValueError("ids and parent_ids must have 32 columns")
+        if <size_t>parent_ids.shape[0] != num_blocks or <size_t>heights.shape[0] != num_blocks or (
+                timestamps is not None and <size_t>timestamps.shape[0] != num_blocks):
+            raise ValueError("all columns must have the same length")
+
+        cdef const uint64_t* ts = &timestamps[0] if timestamps is not None else NULL
+        cdef lux_error_t err = lux_chain_add_blocks(
+            self.chain,
+            &ids[0, 0],
+            &parent_ids[0, 0],
+            &heights[0],
+            ts,
+            num_blocks
+        )
+        self._stats_version += 1
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to add blocks: {lux_error_string(err).decode()}")
+
+    def process_vote(self, Vote vote):
+        """Process a vote (the GIL is released while the engine runs)"""
+        cdef lux_error_t err
+        with nogil:
+            err = lux_consensus_process_vote(self.chain, &vote.vote)
+        self._stats_version += 1
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to process vote: {lux_error_string(err).decode()}")
+
+    async def aprocess_vote(self, Vote vote):
+        """Awaitable process_vote, run on the event loop's default executor"""
+        await asyncio.get_running_loop().run_in_executor(None, self.process_vote, vote)
+
+    def process_votes_parallel(self, votes, nthreads=None):
+        """Process a batch of votes in order with one native call
+
+        The engine lock is taken once and the GIL released for the whole
+        batch. nthreads is accepted for compatibility and ignored: accepting
+        a block rejects its siblings, so votes are applied serially.
+        """
+        cdef size_t num_votes = len(votes)
+        cdef uint32_t num_threads = nthreads if nthreads else 1
+        cdef lux_error_t err
+        cdef size_t i
+
+        if num_votes == 0:
+            return
+
+        cdef lux_vote_t* vote_array = <lux_vote_t*>malloc(num_votes * sizeof(lux_vote_t))
+        if vote_array == NULL:
+            raise MemoryError("Failed to allocate memory for votes")
+
+        try:
+            for i in range(num_votes):
+                vote_array[i] = (<Vote?>votes[i]).vote
+
+            with nogil:
+                err = lux_consensus_process_votes_parallel(
+                    self.chain, vote_array, num_votes, num_threads
+                )
+            self._stats_version += 1
+            if err != LUX_SUCCESS:
+                raise ConsensusError(f"Failed to process votes: {lux_error_string(err).decode()}")
+        finally:
+            free(vote_array)
+
+    def process_votes_batch(self, voter_ids, block_ids, preferences):
+        """Process a batch of votes given as columns in a single call
+
+        Args:
+            voter_ids: (N, 32) uint8 or (N,) |S32 array of voter IDs
+            block_ids: (N, 32) uint8 or (N,) |S32 array of block IDs
+            preferences: (N,) bool array, True for a preference vote
+        """
+        cdef const uint8_t[::1] prefs = np.ascontiguousarray(preferences, dtype=np.bool_).view(np.uint8)
+        cdef size_t num_votes = prefs.shape[0]
+        if num_votes == 0:
+            return
+
+        cdef const uint8_t[::1] voters = np.ascontiguousarray(voter_ids).view(np.uint8).reshape(-1)
+        cdef const uint8_t[::1] targets = np.ascontiguousarray(block_ids).view(np.uint8).reshape(-1)
+        if <size_t>voters.shape[0] != num_votes * 32 or <size_t>targets.shape[0] != num_votes * 32:
+            raise ValueError("voter_ids and block_ids must hold one 32-byte ID per preference")
+
+        cdef lux_error_t err
+        with nogil:
+            err = lux_consensus_process_votes_batch(
+                self.chain, &voters[0], &targets[0], &prefs[0], num_votes
+            )
+        self._stats_version += 1
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to process votes: {lux_error_string(err).decode()}")
+
+    def submit_vote_nowait(self, Vote vote):
+        """Queue a vote without waiting for the engine lock
+
+        A single consumer thread drains the queue in batches of up to
+        VOTE_DRAIN_BATCH votes and applies each batch with one native call.
+        Call flush_votes() to wait for queued votes and see their errors.
+        A submit that races a flush waits for it, then starts a fresh
+        consumer, so the vote is never left behind the stop sentinel.
+        """
+        with self._vote_consumer_lock:
+            if self._vote_consumer is None:
+                self._vote_consumer = threading.Thread(
+                    target=_drain_votes,
+                    args=(weakref.ref(self), self._vote_queue, self._vote_errors),
+                    name="lux-vote-consumer",
+                    daemon=True,
+                )
+                self._vote_consumer.start()
+            self._vote_queue.put(vote)
+
+    def flush_votes(self):
+        """Wait until every submitted vote is applied, then stop the consumer
+
+        Call this once producers are done submitting; the next
+        submit_vote_nowait() starts a fresh consumer.
+
+        Raises:
+            ConsensusError: if any queued vote failed
+        """
+        with self._vote_consumer_lock:
+            self._stop_vote_consumer()
+            if not self._vote_errors:
+                return
+            errors = list(self._vote_errors)
+            del self._vote_errors[:]
+        raise ConsensusError(f"{len(errors)} queued vote batch(es) failed: {errors[0]}")
+
+    cdef _stop_vote_consumer(self):
+        """Drain the queue and join the consumer; call with _vote_consumer_lock held"""
+        consumer = self._vote_consumer
+        if consumer is not None:
+            self._vote_queue.put(None)
+            consumer.join()
+            self._vote_consumer = None
+
+    def is_accepted(self, block_id):
+        """Check if a block is accepted"""
+        if len(block_id) != 32:
+            raise ValueError("block_id must be 32 bytes")
+
+        cdef bint accepted = False
+        cdef lux_error_t err = lux_consensus_is_accepted(
+            self.chain,
+            <const uint8_t*>PyBytes_AsString(block_id),
+            &accepted
+        )
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to check acceptance: {lux_error_string(err).decode()}")
+
+        return accepted
+
+    def get_preference(self):
+        """Get the preferred block ID"""
+        cdef uint8_t block_id[32]
+        cdef lux_error_t err = lux_consensus_get_preference(self.chain, block_id)
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to get preference: {lux_error_string(err).decode()}")
+
+        return bytes(block_id[:32])
+
+    def poll(self, validator_ids):
+        """Poll validators (the GIL is released while the engine runs)"""
+        # Snapshot so the ID bytes stay alive while the GIL is released
+        validator_ids = tuple(validator_ids)
+        cdef uint32_t num_validators = len(validator_ids)
+        cdef lux_error_t err
+
+        # Allocate array of validator ID pointers (at least 1 for empty case)
+        cdef uint32_t alloc_size = max(1, num_validators)
+        cdef uint8_t** validator_ptrs = <uint8_t**>malloc(alloc_size * sizeof(uint8_t*))
+        if validator_ptrs == NULL:
+            raise MemoryError("Failed to allocate memory for validator IDs")
+
+        try:
+            # Copy validator IDs
+            for i in range(num_validators):
+                if len(validator_ids[i]) != 32:
+                    raise ValueError(f"validator_id[{i}] must be 32 bytes")
+                validator_ptrs[i] = <uint8_t*>PyBytes_AsString(validator_ids[i])
+
+            # Call poll function
+            with nogil:
+                err = lux_consensus_poll(
+                    self.chain,
+                    num_validators,
+                    <const uint8_t**>validator_ptrs
+                )
+            self._stats_version += 1
+            if err != LUX_SUCCESS:
+                raise ConsensusError(f"Failed to poll: {lux_error_string(err).decode()}")
+        finally:
+            free(validator_ptrs)
+
+    def poll_view(self, validator_ids):
+        """Poll validators given as one (k, 32) uint8 array
+
+        Rows are passed to C in place, so a cached array (or a row slice of
+        one) can be polled repeatedly without building bytes objects.
+        """
+        cdef const uint8_t[:, ::1] ids = validator_ids
+        if ids.shape[1] != 32:
+            raise ValueError("validator_ids must have shape (k, 32)")
+
+        cdef uint32_t num_validators = ids.shape[0]
+        cdef uint32_t i
+        cdef lux_error_t err
+        cdef const uint8_t** validator_ptrs = <const uint8_t**>malloc(max(1, num_validators) * sizeof(uint8_t*))
+        if validator_ptrs == NULL:
+            raise MemoryError("Failed to allocate memory for validator IDs")
+
+        try:
+            for i in range(num_validators):
+                validator_ptrs[i] = &ids[i, 0]
+
+            with nogil:
+                err = lux_consensus_poll(self.chain, num_validators, validator_ptrs)
+            self._stats_version += 1
+            if err != LUX_SUCCESS:
+                raise ConsensusError(f"Failed to poll: {lux_error_string(err).decode()}")
+        finally:
+            free(validator_ptrs)
+
+    async def apoll(self, validator_ids):
+        """Awaitable poll, run on the event loop's default executor
+
+        Accepts a list of 32-byte IDs or a (k, 32) uint8 array (see poll_view).
+        """
+        poll = self.poll_view if isinstance(validator_ids, np.ndarray) else self.poll
+        await asyncio.get_running_loop().run_in_executor(None, poll, validator_ids)
+
+    def get_stats(self):
+        """Get consensus statistics
+
+        The snapshot is reused until the next add_block(s), process_vote(s)
+        or poll call, so repeated reads do not copy the struct again.
+        """
+        if self._stats_cache is not None and self._cached_version == self._stats_version:
+            return self._stats_cache
+
+        # Mutators bump the version after their native call returns, so a
+        # snapshot taken during one is tagged with a version already stale
+        cdef uint64_t version = self._stats_version
+        cdef Stats stats = Stats()
+        cdef lux_error_t err = lux_consensus_get_stats(self.chain, &stats.stats)
+        if err != LUX_SUCCESS:
+            raise ConsensusError(f"Failed to get stats: {lux_error_string(err).decode()}")
+
+        self._stats_cache = stats
+        self._cached_version = version
+        return stats
+
+def _drain_votes(engine_ref, vote_queue, vote_errors):
+    """Consumer loop for submit_vote_nowait(); exits on a None sentinel
+
+    The engine is dereferenced only while a batch is applied, so an idle
+    consumer does not keep it alive.
+    """
+    running = True
+    while running:
+        batch = []
+        vote = vote_queue.get()
+        while vote is not None:
+            batch.append(vote)
+            if len(batch) == VOTE_DRAIN_BATCH:
+                break
+            try:
+                vote = vote_queue.get_nowait()
+            except queue.Empty:
+                break
+        running = vote is not None
+        if batch:
+            engine = engine_ref()
+            if engine is None:
+                return
+            try:
+                engine.process_votes_parallel(batch)
+            except ConsensusError as e:
+                vote_errors.append(e)
+            engine = None
+
+# Module-level utility functions
+def error_string(error_code):
+    """Get error string for an error code"""
+    return lux_error_string(error_code).decode()
+
+def engine_type_string(engine_type):
+    """Get engine type string"""
+    if 0 <= engine_type < len(_ENGINE_TYPE_STRINGS):
+        return _ENGINE_TYPE_STRINGS[engine_type]
+    return "Unknown"
@@ -20,6 +20,9 @@ class MLXConsensusModel(nn.Module):
         self.output = nn.Linear(hidden_size // 2, 1)
 
     def __call__(self, x):
+        # Raw vote bytes arrive as uint8; normalise on device
+        if x.dtype == mx.uint8:
+            x = x.astype(mx.float32) * (1.0 / 255.0)
         x = nn.relu(self.layer1(x))
         x = nn.relu(self.layer2(x))
         return nn.sigmoid(self.output(x))
@@ -67,6 +70,15 @@ class MLXConsensusBackend:
         if model_path:
             self.model.load_weights(model_path)
 
+        # Swap Linear layers for 8-bit QuantizedLinear (weights must be loaded first)
+        if enable_quantization:
+            nn.quantize(
+                self.model,
+                group_size=64,
+                bits=8,
+                class_predicate=lambda _, m: isinstance(m, nn.Linear) and m.weight.shape[-1] % 64 == 0,
+            )
+
         # Vote buffer for batching
         self.vote_buffer: List[Tuple[bytes, bytes, bool]] = []
         self.block_cache = {}
@@ -79,18 +91,18 @@ class MLXConsensusBackend:
             votes: List of (voter_id, block_id, is_preference) tuples
 
         Returns:
-            MLX array of shape (n, 64) with normalized values
+            uint8 MLX array of shape (n, 64); the model normalises it on device
         """
-        data = []
-        for voter_id, block_id, _ in votes:
-            # Voter ID (32 bytes)
-            voter_bytes = np.frombuffer(voter_id, dtype=np.uint8).astype(np.float32) / 255.0
-            # Block ID (32 bytes)
-            block_bytes = np.frombuffer(block_id, dtype=np.uint8).astype(np.float32) / 255.0
-            # Concatenate
-            data.append(np.concatenate([voter_bytes, block_bytes]))
+        # Pack every vote into one buffer: voter ID (32 bytes) || block ID (32 bytes)
+        buf = bytearray(len(votes) * 64)
+        for i, (voter_id, block_id, _) in enumerate(votes):
+            if len(voter_id) != 32 or len(block_id) != 32:
+                raise ValueError(f"vote {i}: voter_id and block_id must be 32 bytes")
+            offset = i * 64
+            buf[offset:offset + 32] = voter_id
+            buf[offset + 32:offset + 64] = block_id
 
-        return mx.array(np.array(data))
+        return mx.array(np.frombuffer(buf, dtype=np.uint8).reshape(-1, 64))
 
     def process_votes_batch(self, votes: List[Tuple[bytes, bytes, bool]]) -> int:
         """
@@ -106,23 +118,42 @@ class MLXConsensusBackend:
             return 0
 
         try:
-            # Preprocess
-            input_array = self.preprocess_votes(votes)
+            return self._count_accepted(self.preprocess_votes(votes))
+        except Exception as e:
+            print(f"Error processing vote batch: {e}")
+            return 0
 
-            # Forward pass on GPU
-            output = self.model(input_array)
+    def process_packed_votes(self, packed: np.ndarray) -> int:
+        """
+        Process votes already packed as voter ID || block ID rows
 
-            # Force evaluation on GPU
-            mx.eval(output)
+        Args:
+            packed: uint8 array of shape (n, 64)
 
-            # Count successes (output > 0.5)
-            results = output.squeeze() > 0.5
-            return int(mx.sum(results).item())
+        Returns:
+            Number of votes successfully processed
+        """
+        if len(packed) == 0:
+            return 0
 
+        try:
+            return self._count_accepted(mx.array(packed))
         except Exception as e:
             print(f"Error processing vote batch: {e}")
             return 0
 
+    def _count_accepted(self, input_array: mx.array) -> int:
+        """Run the model on preprocessed votes and count outputs above 0.5"""
+        # Forward pass on GPU
+        output = self.model(input_array)
+
+        # Force evaluation on GPU
+        mx.eval(output)
+
+        # Count successes (output > 0.5)
+        results = output.squeeze() > 0.5
+        return int(mx.sum(results).item())
+
     def validate_blocks_batch(self, block_ids: List[bytes]) -> List[bool]:
         """
         Validate a batch of blocks on GPU
@@ -203,30 +234,50 @@ class MLXConsensusBackend:
 class AdaptiveMLXBatchProcessor:
     """Adaptive batch processor with automatic batch size tuning"""
 
+    # Upper bound for the tuned optimal_batch_size; the vote buffer starts at it
+    MAX_BATCH_SIZE = 128
+
     def __init__(self, backend: MLXConsensusBackend):
         self.backend = backend
         self.optimal_batch_size = 32
-        self.vote_buffer = []
         self.throughput = 0.0
 
+        # Votes are packed in place (voter ID || block ID per row) rather than
+        # kept as tuples
+        self._votes = np.empty((self.MAX_BATCH_SIZE, 64), dtype=np.uint8)
+        self._count = 0
+
     def add_vote(self, voter_id: bytes, block_id: bytes, is_preference: bool):
-        """Add vote to buffer (auto-flushes when optimal)"""
-        self.vote_buffer.append((voter_id, block_id, is_preference))
+        """Add vote to buffer (auto-flushes when optimal)
 
-        if len(self.vote_buffer) >= self.optimal_batch_size:
+        is_preference is accepted for API compatibility; the backend scores
+        the packed IDs only.
+        """
+        if self._count == len(self._votes):
+            # optimal_batch_size was set past the buffer; grow to fit it
+            grown = np.empty((max(self.optimal_batch_size, 2 * self._count), 64), dtype=np.uint8)
+            grown[:self._count] = self._votes
+            self._votes = grown
+        row = self._votes[self._count]
+        row[:32] = np.frombuffer(voter_id, dtype=np.uint8)
+        row[32:] = np.frombuffer(block_id, dtype=np.uint8)
+        self._count += 1
+
+        if self._count >= self.optimal_batch_size:
             self.flush()
 
     def flush(self):
         """Flush buffered votes to GPU"""
-        if not self.vote_buffer:
+        count = self._count
+        if count == 0:
             return
 
         start = time.perf_counter()
-        processed = self.backend.process_votes_batch(self.vote_buffer)
+        processed = self.backend.process_packed_votes(self._votes[:count])
         end = time.perf_counter()
 
         duration = end - start
-        current_throughput = len(self.vote_buffer) / duration if duration > 0 else 0
+        current_throughput = count / duration if duration > 0 else 0
 
         # Update running average (EMA)
         if self.throughput == 0.0:
@@ -237,13 +288,13 @@ class AdaptiveMLXBatchProcessor:
         # Adjust batch size
         self._adjust_batch_size(current_throughput)
 
-        self.vote_buffer.clear()
+        self._count = 0
 
     def _adjust_batch_size(self, current_throughput: float):
         """Adjust batch size based on performance"""
         # Increase if throughput is good
-        if current_throughput > 1_000_000.0 and self.optimal_batch_size < 128:
-            self.optimal_batch_size *= 2
+        if current_throughput > 1_000_000.0 and self.optimal_batch_size < self.MAX_BATCH_SIZE:
+            self.optimal_batch_size = min(self.optimal_batch_size * 2, self.MAX_BATCH_SIZE)
         # Decrease if throughput is poor
         elif current_throughput < 100_000.0 and self.optimal_batch_size > 16:
             self.optimal_batch_size //= 2
@@ -33,17 +33,82 @@ Usage:
     voter_id = voter_id_from_agent("claude")
     vote = Vote(candidate_id=candidate.id, voter_id=voter_id, preference=True)
 
-    # Serialize for transmission
-    data = vote.to_json()
+    # Serialize for transmission (to_json stays available for debugging)
+    data = vote.to_wire()
 """
 
 import hashlib
 import json
+import struct
+import sys
 import time
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from binascii import a2b_hex
+from functools import lru_cache
+from dataclasses import dataclass, field, fields, asdict
+from typing import List, Optional, Sequence
 from enum import IntEnum
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: fastest C JSON codec, preferred when present
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: C JSON encoder for the hot wire types
+    msgspec = None
+
+try:
+    import msgpack
+except ImportError:  # optional: binary storage/RPC encoding
+    msgpack = None
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional: fast local-only ID derivation
+    _blake3 = None
+
+# __slots__ for dataclasses where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _now_ms() -> int:
+    """Wall-clock milliseconds, in integer math."""
+    return time.time_ns() // 1_000_000
+
+
+# JSON codec: orjson, then msgspec, then the stdlib. All three emit the
+# same compact output.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+elif msgspec is not None:
+    _json_encode = msgspec.json.Encoder().encode
+    _json_loads = msgspec.json.Decoder().decode
+
+    def _json_dumps(obj) -> str:
+        return _json_encode(obj).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        # Compact and unescaped so output matches orjson/msgspec byte for byte
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _enc(data: Optional[bytes]) -> Optional[str]:
+    """Hex-encode an optional bytes field (empty or None -> None)."""
+    return data.hex() if data else None
+
+
+def _dec(text: Optional[str]) -> Optional[bytes]:
+    """Decode an optional hex field; a2b_hex is faster than bytes.fromhex."""
+    return a2b_hex(text) if text else None
+
 
 # =============================================================================
 # CORE INVARIANT: Everything is a Candidate
@@ -55,6 +120,22 @@ from enum import IntEnum
 NODE_ID_DOMAIN = "LuxNodeID/v1"
 
 
+@lru_cache(maxsize=32)
+def _seeded_state(domain: bytes):
+    h = hashlib.sha256()
+    h.update(domain)
+    return h
+
+
+def _seeded(domain: bytes):
+    """SHA-256 state that has already absorbed domain.
+
+    Callers must copy() it before updating; the cached object is shared.
+    Any bytes-like domain is accepted; it is keyed as bytes.
+    """
+    return _seeded_state(bytes(domain))
+
+
 def derive_voter_id(domain: str, data: bytes) -> bytes:
     """Derive a 32-byte VoterID: H(domain || data).
 
@@ -80,6 +161,47 @@ def derive_voter_id(domain: str, data: bytes) -> bytes:
     return h.digest()
 
 
+def derive_voter_ids_batch(domain: str, items: Sequence[bytes]) -> np.ndarray:
+    """Derive many VoterIDs under one domain.
+
+    Row i equals derive_voter_id(domain, items[i]). The domain is hashed
+    once and the seeded state is copied per item, and digests are written
+    straight into a preallocated array.
+
+    Args:
+        domain: Context identifier shared by every item
+        items: Raw bytes to hash, one entry per voter
+
+    Returns:
+        (len(items), 32) uint8 array of VoterIDs
+    """
+    seeded = _seeded(domain.encode())
+    out = np.empty((len(items), 32), dtype=np.uint8)
+    buf = memoryview(out.reshape(-1))
+    for i, data in enumerate(items):
+        h = seeded.copy()
+        h.update(data)
+        buf[i * 32:(i + 1) * 32] = h.digest()
+    return out
+
+
+def derive_voter_id_fast(domain: str, data: bytes) -> bytes:
+    """Derive a 32-byte local VoterID with BLAKE3: H(domain || data).
+
+    For internal addressing only. The result differs from derive_voter_id
+    and must never go on the wire or be compared with a NodeID; SHA-256
+    remains the canonical derivation.
+
+    Raises:
+        ImportError: if the optional blake3 package is not installed
+    """
+    if _blake3 is None:
+        raise ImportError("derive_voter_id_fast requires blake3: pip install lux-consensus[blake3]")
+    h = _blake3(domain.encode())
+    h.update(data)
+    return h.digest()
+
+
 def voter_id_from_public_key(public_key: bytes) -> bytes:
     """Derive VoterID from public key using NODE_ID_DOMAIN.
 
@@ -98,14 +220,77 @@ def derive_item_id(data: bytes) -> bytes:
     return hashlib.sha256(data).digest()
 
 
+def derive_item_id_fast(data: bytes) -> bytes:
+    """Derive a 32-byte local ItemID with BLAKE3.
+
+    Local-only counterpart of derive_item_id; see derive_voter_id_fast.
+    """
+    if _blake3 is None:
+        raise ImportError("derive_item_id_fast requires blake3: pip install lux-consensus[blake3]")
+    return _blake3(data).digest()
+
+
 def compute_candidate_id(domain: bytes, payload: bytes) -> bytes:
     """Compute content-addressed candidate ID: H(domain || payload)."""
-    h = hashlib.sha256()
-    h.update(domain)
+    h = _seeded(domain).copy()
     h.update(payload)
     return h.digest()
 
 
+def compute_candidate_ids_batch(domains: Sequence[bytes], payloads: Sequence[bytes]) -> np.ndarray:
+    """Compute many candidate IDs for backlog/mempool replay.
+
+    Row i equals compute_candidate_id(domains[i], payloads[i]). Each
+    distinct domain is absorbed once through the seeded-state cache and
+    digests land in a preallocated array.
+
+    Returns:
+        (len(payloads), 32) uint8 array of candidate IDs
+    """
+    if len(domains) != len(payloads):
+        raise ValueError("domains and payloads must have the same length")
+    out = np.empty((len(payloads), 32), dtype=np.uint8)
+    buf = memoryview(out.reshape(-1))
+    for i, (domain, payload) in enumerate(zip(domains, payloads)):
+        h = _seeded(domain).copy()
+        h.update(payload)
+        buf[i * 32:(i + 1) * 32] = h.digest()
+    return out
+
+
+# Shared domain objects so candidates in one domain hold a single buffer.
+# Capped so a stream of unique domains cannot grow it without bound.
+_DOMAIN_INTERN: dict = {}
+_DOMAIN_INTERN_MAX = 256
+
+
+def _intern_domain(domain: bytes) -> bytes:
+    domain = bytes(domain)
+    cached = _DOMAIN_INTERN.get(domain)
+    if cached is not None:
+        return cached
+    if len(_DOMAIN_INTERN) < _DOMAIN_INTERN_MAX:
+        _DOMAIN_INTERN[domain] = domain
+    return domain
+
+
+# Larger payloads are hashed directly: the cache would pin them in memory,
+# and a repeat of a large payload is rare next to the cost of hashing it
+_CANDIDATE_ID_CACHE_MAX_PAYLOAD = 1024
+
+
+@lru_cache(maxsize=4096)
+def _candidate_id_lru(domain: bytes, payload: bytes) -> bytes:
+    return compute_candidate_id(domain, payload)
+
+
+def _cached_candidate_id(domain: bytes, payload: bytes) -> bytes:
+    """compute_candidate_id, memoised for repeated small (domain, payload) pairs."""
+    if len(payload) > _CANDIDATE_ID_CACHE_MAX_PAYLOAD:
+        return compute_candidate_id(domain, payload)
+    return _candidate_id_lru(bytes(domain), bytes(payload))
+
+
 # =============================================================================
 # POLICY IDS
 # =============================================================================
@@ -119,6 +304,17 @@ class PolicyID(IntEnum):
     QUANTUM = 4            # BLS + Corona post-quantum
 
 
+# Valid policy ids as plain ints, for decoding without EnumMeta.__call__
+_POLICY_IDS = frozenset(int(p) for p in PolicyID)
+
+
+def _policy_id(value) -> int:
+    pid = int(value)
+    if pid not in _POLICY_IDS:
+        raise ValueError(f"unknown policy_id: {pid}")
+    return pid
+
+
 # Signature scheme tags
 SIG_NONE = 0x00
 SIG_ED25519 = 0x01
@@ -126,67 +322,275 @@ SIG_BLS = 0x02
 SIG_CORONA = 0x03
 SIG_QUASAR = 0x04  # BLS + Corona (Quasar protocol)
 
+_SIG_SCHEMES = frozenset({SIG_NONE, SIG_ED25519, SIG_BLS, SIG_CORONA, SIG_QUASAR})
+
+
+def _id_field(d: dict, key: str) -> bytes:
+    """Decode a required 32-byte hex id, checking its length before decoding."""
+    text = d[key]
+    if not isinstance(text, str) or len(text) != 64:
+        raise ValueError(f"{key}: expected 32-byte hex id")
+    return a2b_hex(text)
+
+
+def _meta_field(d: dict) -> Optional["CandidateMeta"]:
+    """Candidate meta from a dict: an explicit null means no meta, while a
+    missing key (older encoders) decodes to a default CandidateMeta."""
+    if "meta" not in d:
+        return CandidateMeta.from_dict({})
+    meta = d["meta"]
+    return CandidateMeta.from_dict(meta) if meta is not None else None
+
+
+def _signature_field(d: dict) -> Optional[bytes]:
+    """Decode an optional signature, rejecting unknown scheme tags up front."""
+    text = d.get("signature")
+    if not text:
+        return None
+    if int(text[:2], 16) not in _SIG_SCHEMES:
+        raise ValueError(f"signature: unknown scheme tag 0x{text[:2]}")
+    return a2b_hex(text)
+
+
+# =============================================================================
+# BINARY WIRE ENCODING
+# =============================================================================
+# Big-endian, fixed header first, then length-prefixed variable fields.
+
+# candidate_id, voter_id, round, preference, timestamp_ms; signature follows
+_VOTE_WIRE = struct.Struct(">32s32sQ?Q")
+# id, parent_id, height, has_meta, timestamp_ms; then domain, payload,
+# da_ref, proposer_id, chain_id, extra as length-prefixed fields
+_CANDIDATE_WIRE = struct.Struct(">32s32sQ?Q")
+# candidate_id, height, policy_id, timestamp_ms; then proof, signers
+_CERTIFICATE_WIRE = struct.Struct(">32sQBQ")
+_LEN = struct.Struct(">I")
+_LEN_NONE = 0xFFFFFFFF  # Length marking an absent optional field
+
+
+def _wire_id(value: bytes, name: str) -> bytes:
+    """Check a fixed-width id before packing; "32s" would pad or truncate it."""
+    if len(value) != 32:
+        raise ValueError(f"{name}: expected 32 bytes, got {len(value)}")
+    return value
+
+
+def _pack_header(header: struct.Struct, *values) -> bytes:
+    """Pack a fixed header, raising ValueError (not struct.error) for a
+    negative or out-of-range integer field."""
+    try:
+        return header.pack(*values)
+    except struct.error as e:
+        raise ValueError(f"field out of range for wire header: {e}") from None
+
+
+def _unpack_header(header: struct.Struct, buf: bytes) -> tuple:
+    """Unpack a fixed header, raising ValueError (not struct.error) if short."""
+    if len(buf) < header.size:
+        raise ValueError(f"truncated wire header: {len(buf)} < {header.size} bytes")
+    return header.unpack_from(buf, 0)
+
+
+def _pack_var(parts: list, data: Optional[bytes]) -> None:
+    """Append a length-prefixed field (None encodes as _LEN_NONE)."""
+    if data is None:
+        parts.append(_LEN.pack(_LEN_NONE))
+    else:
+        parts.append(_LEN.pack(len(data)))
+        parts.append(data)
+
+
+def _unpack_var(buf: bytes, offset: int):
+    """Read a length-prefixed field; returns (data or None, next offset)."""
+    if offset + _LEN.size > len(buf):
+        raise ValueError("truncated wire field")
+    (n,) = _LEN.unpack_from(buf, offset)
+    offset += _LEN.size
+    if n == _LEN_NONE:
+        return None, offset
+    end = offset + n
+    if end > len(buf):
+        raise ValueError("truncated wire field")
+    return bytes(buf[offset:end]), end
+
+
+# =============================================================================
+# MSGPACK ENCODING
+# =============================================================================
+# Field dicts with bytes kept as native bin values (no hex round trip).
+# Nested records (dataclasses, or classes listing _FIELDS) pack as nested dicts.
+
+def _is_record(value) -> bool:
+    return hasattr(value, "_FIELDS") or hasattr(value, "__dataclass_fields__")
+
+
+def _msgpack_fields(obj) -> dict:
+    """Field dict of a record, recursing into nested records and lists."""
+    names = getattr(obj, "_FIELDS", None)
+    if names is None:
+        names = [f.name for f in fields(obj) if f.init]
+    out = {}
+    for name in names:
+        value = getattr(obj, name)
+        if _is_record(value):
+            value = _msgpack_fields(value)
+        elif isinstance(value, (list, tuple)):
+            value = [_msgpack_fields(v) if _is_record(v) else v for v in value]
+        out[name] = value
+    return out
+
+
+def _msgpack_pack(obj) -> bytes:
+    if msgpack is None:
+        raise ImportError("to_msgpack requires msgpack: pip install lux-consensus[msgpack]")
+    return msgpack.packb(_msgpack_fields(obj), use_bin_type=True)
+
+
+def _msgpack_unpack(buf: bytes) -> dict:
+    if msgpack is None:
+        raise ImportError("from_msgpack requires msgpack: pip install lux-consensus[msgpack]")
+    return msgpack.unpackb(buf, raw=False)
+
 
 # =============================================================================
 # CANDIDATE
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class CandidateMeta:
     """Candidate metadata."""
     proposer_id: Optional[bytes] = None
-    timestamp_ms: int = field(default_factory=lambda: int(time.time() * 1000))
+    timestamp_ms: int = field(default_factory=_now_ms)
     chain_id: Optional[bytes] = None
     extra: Optional[bytes] = None
 
     def to_dict(self) -> dict:
         return {
-            "proposer_id": self.proposer_id.hex() if self.proposer_id else None,
+            "proposer_id": _enc(self.proposer_id),
             "timestamp_ms": self.timestamp_ms,
-            "chain_id": self.chain_id.hex() if self.chain_id else None,
-            "extra": self.extra.hex() if self.extra else None,
+            "chain_id": _enc(self.chain_id),
+            "extra": _enc(self.extra),
         }
 
     @classmethod
     def from_dict(cls, d: dict) -> "CandidateMeta":
         return cls(
-            proposer_id=bytes.fromhex(d["proposer_id"]) if d.get("proposer_id") else None,
-            timestamp_ms=d.get("timestamp_ms", int(time.time() * 1000)),
-            chain_id=bytes.fromhex(d["chain_id"]) if d.get("chain_id") else None,
-            extra=bytes.fromhex(d["extra"]) if d.get("extra") else None,
+            proposer_id=_dec(d.get("proposer_id")),
+            timestamp_ms=d.get("timestamp_ms", _now_ms()),
+            chain_id=_dec(d.get("chain_id")),
+            extra=_dec(d.get("extra")),
         )
 
+    def to_msgpack(self) -> bytes:
+        return _msgpack_pack(self)
+
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "CandidateMeta":
+        return cls(**_msgpack_unpack(buf))
+
+
+# Wire fields for a candidate without metadata (has_meta is False)
+_NO_META = CandidateMeta(timestamp_ms=0)
+
 
-@dataclass
 class Candidate:
     """Candidate being sequenced (block, transaction, AI decision, etc.).
 
     Core invariant: ID = H(domain || payload)
+
+    A plain __slots__ class rather than a dataclass: candidates are built
+    per gossip message, and a hand-written __init__ stores straight into
+    the slots. Like Vote, it compares all fields and is unhashable.
     """
-    id: bytes              # 32-byte content-addressed ID
-    parent_id: bytes       # Previous candidate (optional)
-    height: int            # Sequence number
-    domain: bytes          # Context identifier
-    payload: bytes         # Actual content
-    da_ref: str = ""       # Data availability reference
-    meta: CandidateMeta = field(default_factory=CandidateMeta)
+    _FIELDS = ("id", "parent_id", "height", "domain", "payload", "da_ref", "meta")
+    # id, domain and payload sit behind properties so that reassigning
+    # any of them drops a cached verify() result
+    __slots__ = ("_id", "parent_id", "height", "_domain", "_payload", "da_ref", "meta", "_verified")
+
+    def __init__(self, id: bytes, parent_id: bytes, height: int, domain: bytes,
+                 payload: bytes, da_ref: str = "", meta: Optional[CandidateMeta] = None):
+        self._id = id               # 32-byte content-addressed ID
+        self.parent_id = parent_id  # Previous candidate (optional)
+        self.height = height        # Sequence number
+        self._domain = domain       # Context identifier
+        self._payload = payload     # Actual content
+        self.da_ref = da_ref        # Data availability reference
+        self.meta = meta            # Optional; None until metadata is attached
+        self._verified = False      # Set once verify() has matched id against content
+
+    @property
+    def id(self) -> bytes:
+        return self._id
+
+    @id.setter
+    def id(self, value: bytes) -> None:
+        self._id = value
+        self._verified = False
+
+    @property
+    def domain(self) -> bytes:
+        return self._domain
+
+    @domain.setter
+    def domain(self, value: bytes) -> None:
+        self._domain = value
+        self._verified = False
+
+    @property
+    def payload(self) -> bytes:
+        return self._payload
+
+    @payload.setter
+    def payload(self, value: bytes) -> None:
+        self._payload = value
+        self._verified = False
+
+    def _key(self) -> tuple:
+        return (self._id, self.parent_id, self.height, self._domain,
+                self._payload, self.da_ref, self.meta)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # Mutable, as with the dataclass it replaces
+
+    def __repr__(self):
+        fields_repr = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"Candidate({fields_repr})"
 
     @classmethod
     def new(cls, domain: bytes, payload: bytes, height: int,
-            parent_id: bytes = b'\x00' * 32) -> "Candidate":
-        """Create a new candidate with computed ID."""
-        candidate_id = compute_candidate_id(domain, payload)
+            parent_id: bytes = b'\x00' * 32,
+            now_ms: Optional[int] = None) -> "Candidate":
+        """Create a new candidate with computed ID.
+
+        Pass now_ms to reuse one clock reading across a batch of candidates;
+        by default the current time is read per candidate.
+        """
+        domain = _intern_domain(domain)
+        candidate_id = _cached_candidate_id(domain, payload)
+        meta = CandidateMeta() if now_ms is None else CandidateMeta(timestamp_ms=now_ms)
         return cls(
             id=candidate_id,
             parent_id=parent_id,
             height=height,
             domain=domain,
             payload=payload,
+            meta=meta,
         )
 
     def verify(self) -> bool:
-        """Verify that ID matches content."""
-        return self.id == compute_candidate_id(self.domain, self.payload)
+        """Verify that ID matches content.
+
+        A successful check is remembered, so later calls skip the hash,
+        until id, domain or payload is reassigned.
+        """
+        if self._verified:
+            return True
+        self._verified = self.id == compute_candidate_id(self.domain, self.payload)
+        return self._verified
 
     def to_dict(self) -> dict:
         return {
@@ -196,42 +600,132 @@ class Candidate:
             "domain": self.domain.hex(),
             "payload": self.payload.hex(),
             "da_ref": self.da_ref,
-            "meta": self.meta.to_dict(),
+            "meta": self.meta.to_dict() if self.meta is not None else None,
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
+
+    def to_wire(self) -> bytes:
+        """Encode as the compact binary wire format."""
+        meta = self.meta if self.meta is not None else _NO_META
+        parts = [_pack_header(_CANDIDATE_WIRE, _wire_id(self.id, "id"), _wire_id(self.parent_id, "parent_id"),
+                              self.height, self.meta is not None, meta.timestamp_ms)]
+        _pack_var(parts, self.domain)
+        _pack_var(parts, self.payload)
+        _pack_var(parts, self.da_ref.encode())
+        _pack_var(parts, meta.proposer_id)
+        _pack_var(parts, meta.chain_id)
+        _pack_var(parts, meta.extra)
+        return b"".join(parts)
+
+    @classmethod
+    def from_wire(cls, buf: bytes) -> "Candidate":
+        candidate_id, parent_id, height, has_meta, timestamp_ms = _unpack_header(_CANDIDATE_WIRE, buf)
+        offset = _CANDIDATE_WIRE.size
+        domain, offset = _unpack_var(buf, offset)
+        payload, offset = _unpack_var(buf, offset)
+        da_ref, offset = _unpack_var(buf, offset)
+        proposer_id, offset = _unpack_var(buf, offset)
+        chain_id, offset = _unpack_var(buf, offset)
+        extra, offset = _unpack_var(buf, offset)
+        meta = CandidateMeta(
+            proposer_id=proposer_id,
+            timestamp_ms=timestamp_ms,
+            chain_id=chain_id,
+            extra=extra,
+        ) if has_meta else None
+        return cls(
+            id=candidate_id,
+            parent_id=parent_id,
+            height=height,
+            domain=_intern_domain(domain or b""),
+            payload=payload or b"",
+            da_ref=(da_ref or b"").decode(),
+            meta=meta,
+        )
 
     @classmethod
     def from_dict(cls, d: dict) -> "Candidate":
         return cls(
-            id=bytes.fromhex(d["id"]),
-            parent_id=bytes.fromhex(d["parent_id"]),
+            id=_id_field(d, "id"),
+            parent_id=_id_field(d, "parent_id"),
             height=d["height"],
-            domain=bytes.fromhex(d["domain"]),
-            payload=bytes.fromhex(d["payload"]),
+            domain=_intern_domain(a2b_hex(d["domain"])),
+            payload=a2b_hex(d["payload"]),
             da_ref=d.get("da_ref", ""),
-            meta=CandidateMeta.from_dict(d.get("meta", {})),
+            meta=_meta_field(d),
         )
 
     @classmethod
     def from_json(cls, data: str) -> "Candidate":
-        return cls.from_dict(json.loads(data))
+        return cls.from_dict(_json_loads(data))
+
+    def to_msgpack(self) -> bytes:
+        """Encode for storage/RPC; bytes fields stay binary."""
+        return _msgpack_pack(self)
+
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "Candidate":
+        d = _msgpack_unpack(buf)
+        if d["meta"] is not None:
+            d["meta"] = CandidateMeta(**d["meta"])
+        return cls(**d)
+
+
+def pack_candidates(candidates: Sequence[Candidate]):
+    """Pack candidates into the columns ConsensusEngine.add_blocks_soa takes.
+
+    Returns:
+        (ids, parent_ids, heights): (N, 32) uint8, (N, 32) uint8 and
+        (N,) uint64 arrays, contiguous and ready to hand to C
+    """
+    n = len(candidates)
+    ids = np.frombuffer(b"".join(c.id for c in candidates), dtype=np.uint8)
+    parent_ids = np.frombuffer(b"".join(c.parent_id for c in candidates), dtype=np.uint8)
+    if ids.size != n * 32 or parent_ids.size != n * 32:
+        raise ValueError("candidate id and parent_id must be 32 bytes")
+    heights = np.fromiter((c.height for c in candidates), dtype=np.uint64, count=n)
+    return ids.reshape(n, 32), parent_ids.reshape(n, 32), heights
 
 
 # =============================================================================
 # VOTE
 # =============================================================================
 
-@dataclass
 class Vote:
-    """Attestation on a candidate."""
-    candidate_id: bytes    # What's being voted on
-    voter_id: bytes        # Who's voting
-    round: int = 0         # Voting round
-    preference: bool = True  # Accept or reject
-    signature: Optional[bytes] = None  # Scheme-tagged signature
-    timestamp_ms: int = field(default_factory=lambda: int(time.time() * 1000))
+    """Attestation on a candidate.
+
+    A plain __slots__ class for cheap construction on vote ingress; see
+    Candidate. Votes compare equal when every field matches.
+    """
+    _FIELDS = ("candidate_id", "voter_id", "round", "preference", "signature", "timestamp_ms")
+    __slots__ = _FIELDS
+
+    def __init__(self, candidate_id: bytes, voter_id: bytes, round: int = 0,
+                 preference: bool = True, signature: Optional[bytes] = None,
+                 timestamp_ms: Optional[int] = None):
+        self.candidate_id = candidate_id  # What's being voted on
+        self.voter_id = voter_id          # Who's voting
+        self.round = round                # Voting round
+        self.preference = preference      # Accept or reject
+        self.signature = signature        # Scheme-tagged signature
+        self.timestamp_ms = _now_ms() if timestamp_ms is None else timestamp_ms
+
+    def _key(self) -> tuple:
+        return (self.candidate_id, self.voter_id, self.round,
+                self.preference, self.signature, self.timestamp_ms)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # Mutable, as with the dataclass it replaces
+
+    def __repr__(self):
+        fields_repr = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"Vote({fields_repr})"
 
     def signature_scheme(self) -> int:
         """Return the signature scheme tag."""
@@ -245,42 +739,114 @@ class Vote:
             "voter_id": self.voter_id.hex(),
             "round": self.round,
             "preference": self.preference,
-            "signature": self.signature.hex() if self.signature else None,
+            "signature": _enc(self.signature),
             "timestamp_ms": self.timestamp_ms,
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
+
+    def signing_bytes(self) -> bytes:
+        """Bytes the signature covers: the 81-byte wire header."""
+        return _pack_header(_VOTE_WIRE, _wire_id(self.candidate_id, "candidate_id"),
+                            _wire_id(self.voter_id, "voter_id"), self.round,
+                            self.preference, self.timestamp_ms)
+
+    def to_wire(self) -> bytes:
+        """Encode as the compact binary wire format (81 bytes + signature)."""
+        header = self.signing_bytes()
+        return header + self.signature if self.signature else header
+
+    @classmethod
+    def from_wire(cls, buf: bytes) -> "Vote":
+        candidate_id, voter_id, round, preference, timestamp_ms = _unpack_header(_VOTE_WIRE, buf)
+        return cls(
+            candidate_id=candidate_id,
+            voter_id=voter_id,
+            round=round,
+            preference=preference,
+            signature=bytes(buf[_VOTE_WIRE.size:]) or None,
+            timestamp_ms=timestamp_ms,
+        )
 
     @classmethod
     def from_dict(cls, d: dict) -> "Vote":
         return cls(
-            candidate_id=bytes.fromhex(d["candidate_id"]),
-            voter_id=bytes.fromhex(d["voter_id"]),
+            candidate_id=_id_field(d, "candidate_id"),
+            voter_id=_id_field(d, "voter_id"),
             round=d.get("round", 0),
             preference=d["preference"],
-            signature=bytes.fromhex(d["signature"]) if d.get("signature") else None,
-            timestamp_ms=d.get("timestamp_ms", int(time.time() * 1000)),
+            signature=_signature_field(d),
+            timestamp_ms=d.get("timestamp_ms", _now_ms()),
         )
 
     @classmethod
     def from_json(cls, data: str) -> "Vote":
-        return cls.from_dict(json.loads(data))
+        return cls.from_dict(_json_loads(data))
+
+    def to_msgpack(self) -> bytes:
+        return _msgpack_pack(self)
+
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "Vote":
+        return cls(**_msgpack_unpack(buf))
+
+
+@dataclass(**_SLOTS)
+class VoteBatch:
+    """Votes held as parallel arrays (one row per vote) for bulk tallying."""
+    candidate_ids: np.ndarray  # (N, 32) uint8
+    voter_ids: np.ndarray      # (N, 32) uint8
+    preferences: np.ndarray    # (N,) bool
+    weights: np.ndarray        # (N,) uint32
+
+    @classmethod
+    def from_votes(cls, votes: Sequence[Vote], weights: Optional[Sequence[int]] = None) -> "VoteBatch":
+        """Pack Vote objects; every vote weighs 1 unless weights is given."""
+        n = len(votes)
+        candidate_ids = np.frombuffer(b"".join(v.candidate_id for v in votes), dtype=np.uint8)
+        voter_ids = np.frombuffer(b"".join(v.voter_id for v in votes), dtype=np.uint8)
+        return cls(
+            candidate_ids=candidate_ids.reshape(n, 32),
+            voter_ids=voter_ids.reshape(n, 32),
+            preferences=np.fromiter((v.preference for v in votes), dtype=bool, count=n),
+            weights=(np.ones(n, dtype=np.uint32) if weights is None
+                     else np.asarray(weights, dtype=np.uint32)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.preferences)
+
+    def tally(self) -> dict:
+        """Sum the weight of accepting votes per candidate ID.
+
+        Returns:
+            Mapping of 32-byte candidate ID to accepted weight
+        """
+        accepted = np.ascontiguousarray(self.candidate_ids[self.preferences])
+        keys, inverse = np.unique(accepted.view("V32").reshape(-1), return_inverse=True)
+        totals = np.bincount(inverse, weights=self.weights[self.preferences], minlength=len(keys))
+        return {key.tobytes(): int(total) for key, total in zip(keys, totals)}
 
 
 # =============================================================================
 # CERTIFICATE
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class Certificate:
     """Proof of finalized agreement."""
     candidate_id: bytes    # What was finalized
     height: int            # At what height
-    policy_id: PolicyID    # How finality was achieved
+    policy_id: int         # How finality was achieved (a PolicyID value)
     proof: bytes           # Policy-specific proof
     signers: Optional[bytes] = None  # Who attested
-    timestamp_ms: int = field(default_factory=lambda: int(time.time() * 1000))
+    timestamp_ms: int = field(default_factory=_now_ms)
+
+    @property
+    def policy(self) -> PolicyID:
+        """policy_id as a PolicyID enum member."""
+        return PolicyID(self.policy_id)
 
     def to_dict(self) -> dict:
         return {
@@ -288,27 +854,58 @@ class Certificate:
             "height": self.height,
             "policy_id": int(self.policy_id),
             "proof": self.proof.hex(),
-            "signers": self.signers.hex() if self.signers else None,
+            "signers": _enc(self.signers),
             "timestamp_ms": self.timestamp_ms,
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
+
+    def to_wire(self) -> bytes:
+        """Encode as the compact binary wire format."""
+        parts = [_pack_header(_CERTIFICATE_WIRE, _wire_id(self.candidate_id, "candidate_id"), self.height,
+                              self.policy_id, self.timestamp_ms)]
+        _pack_var(parts, self.proof)
+        _pack_var(parts, self.signers)
+        return b"".join(parts)
+
+    @classmethod
+    def from_wire(cls, buf: bytes) -> "Certificate":
+        candidate_id, height, policy_id, timestamp_ms = _unpack_header(_CERTIFICATE_WIRE, buf)
+        proof, offset = _unpack_var(buf, _CERTIFICATE_WIRE.size)
+        signers, offset = _unpack_var(buf, offset)
+        return cls(
+            candidate_id=candidate_id,
+            height=height,
+            policy_id=_policy_id(policy_id),
+            proof=proof or b"",
+            signers=signers,
+            timestamp_ms=timestamp_ms,
+        )
 
     @classmethod
     def from_dict(cls, d: dict) -> "Certificate":
         return cls(
-            candidate_id=bytes.fromhex(d["candidate_id"]),
+            candidate_id=_id_field(d, "candidate_id"),
             height=d["height"],
-            policy_id=PolicyID(d["policy_id"]),
-            proof=bytes.fromhex(d["proof"]),
-            signers=bytes.fromhex(d["signers"]) if d.get("signers") else None,
-            timestamp_ms=d.get("timestamp_ms", int(time.time() * 1000)),
+            policy_id=_policy_id(d["policy_id"]),
+            proof=a2b_hex(d["proof"]),
+            signers=_dec(d.get("signers")),
+            timestamp_ms=d.get("timestamp_ms", _now_ms()),
         )
 
     @classmethod
     def from_json(cls, data: str) -> "Certificate":
-        return cls.from_dict(json.loads(data))
+        return cls.from_dict(_json_loads(data))
+
+    def to_msgpack(self) -> bytes:
+        return _msgpack_pack(self)
+
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "Certificate":
+        d = _msgpack_unpack(buf)
+        d["policy_id"] = _policy_id(d["policy_id"])
+        return cls(**d)
 
 
 # =============================================================================
@@ -321,7 +918,7 @@ class Phase(IntEnum):
     HARD = 2  # Slow, strong
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgreementState:
     """Tracks two-phase agreement."""
     candidate_id: bytes
@@ -335,9 +932,13 @@ class AgreementState:
 # CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SequencerConfig:
-    """Sequencer pipeline configuration."""
+    """Sequencer pipeline configuration.
+
+    Frozen: the factory functions below return shared cached instances.
+    Use dataclasses.replace() to derive a variant.
+    """
     domain: bytes
     k: int                 # Sample/committee size
     alpha: float           # Agreement threshold
@@ -362,11 +963,11 @@ class SequencerConfig:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
 
-def single_node_config(domain: bytes) -> SequencerConfig:
-    """Config for K=1 self-sequencing."""
+@lru_cache(maxsize=256)
+def _single_node_config(domain: bytes) -> SequencerConfig:
     return SequencerConfig(
         domain=domain,
         k=1,
@@ -380,8 +981,13 @@ def single_node_config(domain: bytes) -> SequencerConfig:
     )
 
 
-def agent_mesh_config(domain: bytes, k: int = 5) -> SequencerConfig:
-    """Config for K=3/5 agent mesh."""
+def single_node_config(domain: bytes) -> SequencerConfig:
+    """Config for K=1 self-sequencing. Any bytes-like domain is accepted."""
+    return _single_node_config(bytes(domain))
+
+
+@lru_cache(maxsize=256)
+def _agent_mesh_config(domain: bytes, k: int = 5) -> SequencerConfig:
     return SequencerConfig(
         domain=domain,
         k=k,
@@ -395,8 +1001,13 @@ def agent_mesh_config(domain: bytes, k: int = 5) -> SequencerConfig:
     )
 
 
-def blockchain_config(domain: bytes) -> SequencerConfig:
-    """Config for large permissionless network."""
+def agent_mesh_config(domain: bytes, k: int = 5) -> SequencerConfig:
+    """Config for K=3/5 agent mesh. Any bytes-like domain is accepted."""
+    return _agent_mesh_config(bytes(domain), k)
+
+
+@lru_cache(maxsize=256)
+def _blockchain_config(domain: bytes) -> SequencerConfig:
     return SequencerConfig(
         domain=domain,
         k=20,
@@ -410,8 +1021,13 @@ def blockchain_config(domain: bytes) -> SequencerConfig:
     )
 
 
-def rollup_config(domain: bytes) -> SequencerConfig:
-    """Config for OP Stack style rollup."""
+def blockchain_config(domain: bytes) -> SequencerConfig:
+    """Config for large permissionless network. Any bytes-like domain is accepted."""
+    return _blockchain_config(bytes(domain))
+
+
+@lru_cache(maxsize=256)
+def _rollup_config(domain: bytes) -> SequencerConfig:
     return SequencerConfig(
         domain=domain,
         k=1,
@@ -425,13 +1041,21 @@ def rollup_config(domain: bytes) -> SequencerConfig:
     )
 
 
+def rollup_config(domain: bytes) -> SequencerConfig:
+    """Config for OP Stack style rollup. Any bytes-like domain is accepted."""
+    return _rollup_config(bytes(domain))
+
+
 # =============================================================================
 # LEGACY COMPATIBILITY
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ConsensusParams:
-    """Legacy consensus parameters (for backward compatibility)."""
+    """Legacy consensus parameters (for backward compatibility).
+
+    Frozen, like SequencerConfig; the factories return cached instances.
+    """
     k: int = 3
     alpha: float = 0.6
     beta_1: float = 0.5
@@ -442,19 +1066,22 @@ class ConsensusParams:
         return asdict(self)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
 
+@lru_cache(maxsize=None)
 def default_params() -> ConsensusParams:
     """Default consensus parameters."""
     return ConsensusParams()
 
 
+@lru_cache(maxsize=None)
 def blockchain_params() -> ConsensusParams:
     """Blockchain-tuned parameters."""
     return ConsensusParams(k=20, alpha=0.65, beta_1=0.5, beta_2=0.8, rounds=10)
 
 
+@lru_cache(maxsize=None)
 def ai_agent_params() -> ConsensusParams:
     """AI agent-tuned parameters."""
     return ConsensusParams(k=3, alpha=0.6, beta_1=0.5, beta_2=0.8, rounds=3)
@@ -470,7 +1097,7 @@ Result = Certificate  # Legacy alias
 # VALIDATOR SET (for Membership interface)
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class Validator:
     """Participant in consensus."""
     id: bytes              # Voter identifier
@@ -482,30 +1109,121 @@ class Validator:
         return {
             "id": self.id.hex(),
             "weight": self.weight,
-            "public_key": self.public_key.hex() if self.public_key else None,
+            "public_key": _enc(self.public_key),
             "transport_addr": self.transport_addr,
         }
 
     @classmethod
     def from_dict(cls, d: dict) -> "Validator":
         return cls(
-            id=bytes.fromhex(d["id"]),
+            id=a2b_hex(d["id"]),
             weight=d.get("weight", 1),
-            public_key=bytes.fromhex(d["public_key"]) if d.get("public_key") else None,
+            public_key=_dec(d.get("public_key")),
             transport_addr=d.get("transport_addr", ""),
         )
 
+    def to_msgpack(self) -> bytes:
+        return _msgpack_pack(self)
 
-@dataclass
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "Validator":
+        return cls(**_msgpack_unpack(buf))
+
+
+class _ValidatorList(list):
+    """List that counts in-place changes, so ValidatorSet can tell when its
+    arrays are stale without rescanning the validators."""
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+
+def _counting(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        self.version += 1
+        return method(self, *args)
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_ValidatorList, _name, _counting(_name))
+del _name
+
+
+@dataclass(**_SLOTS)
 class ValidatorSet:
-    """Set of validators for an epoch."""
+    """Set of validators for an epoch.
+
+    weights and ids_matrix are parallel arrays over validators, rebuilt
+    lazily after the list changes. Call refresh() after editing a
+    Validator's id or weight in place. If ids differ in length,
+    ids_matrix is None and contains() falls back to a set lookup.
+    """
     epoch: int
     validators: List[Validator]
     total_weight: int = 0
+    # (validators list, its version) the cached arrays were built from
+    _arrays_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _arrays: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        self.validators = _ValidatorList(self.validators)
         if self.total_weight == 0:
-            self.total_weight = sum(v.weight for v in self.validators)
+            self.total_weight = int(self.weights.sum())
+
+    def _index(self) -> tuple:
+        """(weights, ids_matrix, sorted_ids, id_set), rebuilt if validators changed."""
+        validators = self.validators
+        if type(validators) is not _ValidatorList:  # Reassigned since construction
+            validators = self.validators = _ValidatorList(validators)
+        key = self._arrays_key
+        if key is None or key[0] is not validators or key[1] != validators.version:
+            self._arrays = self._build_index(validators)
+            self._arrays_key = (validators, validators.version)
+        return self._arrays
+
+    @staticmethod
+    def _build_index(validators: List[Validator]) -> tuple:
+        n = len(validators)
+        weights = np.fromiter((v.weight for v in validators), dtype=np.int64, count=n)
+        weights.flags.writeable = False  # A cache: writes would be lost on rebuild
+        id_len = len(validators[0].id) if n else 32
+        if any(len(v.id) != id_len for v in validators):
+            # Mixed id lengths: no rectangular matrix, membership via a set
+            return weights, None, None, frozenset(v.id for v in validators)
+        ids_matrix = np.frombuffer(b"".join(v.id for v in validators), dtype=np.uint8).reshape(n, id_len)
+        return weights, ids_matrix, np.sort(ids_matrix.view(f"V{id_len}").reshape(-1)), None
+
+    @property
+    def weights(self) -> np.ndarray:
+        """(N,) int64 validator weights (read-only)."""
+        return self._index()[0]
+
+    @property
+    def ids_matrix(self) -> Optional[np.ndarray]:
+        """(N, id_len) uint8 validator ids, or None if id lengths differ."""
+        return self._index()[1]
+
+    def refresh(self) -> None:
+        """Rebuild the arrays on next use, e.g. after editing a Validator in place."""
+        self._arrays_key = None
+
+    def contains(self, voter_id: bytes) -> bool:
+        """Whether voter_id belongs to this set (binary search over sorted ids)."""
+        _, _, ids, id_set = self._index()
+        if ids is None:
+            return voter_id in id_set
+        if len(voter_id) != ids.dtype.itemsize:
+            return False
+        key = np.void(voter_id)
+        i = np.searchsorted(ids, key)
+        return bool(i < len(ids) and ids[i] == key)
 
     def to_dict(self) -> dict:
         return {
@@ -515,7 +1233,7 @@ class ValidatorSet:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _json_dumps(self.to_dict())
 
     @classmethod
     def from_dict(cls, d: dict) -> "ValidatorSet":
@@ -527,7 +1245,16 @@ class ValidatorSet:
 
     @classmethod
     def from_json(cls, data: str) -> "ValidatorSet":
-        return cls.from_dict(json.loads(data))
+        return cls.from_dict(_json_loads(data))
+
+    def to_msgpack(self) -> bytes:
+        return _msgpack_pack(self)
+
+    @classmethod
+    def from_msgpack(cls, buf: bytes) -> "ValidatorSet":
+        d = _msgpack_unpack(buf)
+        d["validators"] = [Validator(**v) for v in d["validators"]]
+        return cls(**d)
 
 
 # =============================================================================
@@ -572,7 +1299,7 @@ class SequencerIdentity:
         return cls(
             sequencer_type=SequencerType(d["sequencer_type"]),
             chain_id=d["chain_id"],
-            domain=bytes.fromhex(d["domain"]),
+            domain=a2b_hex(d["domain"]),
             parent_chain_id=d.get("parent_chain_id"),
             external_rpc=d.get("external_rpc"),
             depth=d.get("depth", 0),
@@ -667,7 +1394,7 @@ class NetworkNode:
         node = cls(
             identity=SequencerIdentity.from_dict(d["identity"]),
             config=SequencerConfig(
-                domain=bytes.fromhex(d["config"]["domain"]),
+                domain=a2b_hex(d["config"]["domain"]),
                 k=d["config"]["k"],
                 alpha=d["config"]["alpha"],
                 beta_1=d["config"]["beta_1"],
@@ -0,0 +1,125 @@
+"""Batch signature verification for wire Votes.
+
+Votes are grouped by signature scheme. BLS votes are first checked with
+one aggregate verification over the whole group; if that fails, each BLS
+signature is checked on its own to find the bad ones. Ed25519 signatures
+are always checked one by one. Per-vote checks run on a thread pool.
+
+A vote signs its fixed wire header (Vote.signing_bytes), so the signature
+covers candidate, voter, round, preference and timestamp.
+
+Usage:
+    from lux_consensus.verify import verify_votes_batch
+
+    ok = verify_votes_batch(votes, pubkeys)  # pubkeys: voter_id -> public key
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence
+
+from .types import Vote, SIG_BLS, SIG_ED25519
+
+try:
+    from blspy import G1Element, G2Element, PopSchemeMPL
+except ImportError:  # optional: BLS verification
+    PopSchemeMPL = None
+
+try:
+    from nacl.exceptions import BadSignatureError
+    from nacl.signing import VerifyKey
+except ImportError:  # optional: Ed25519 verification
+    VerifyKey = None
+
+# Verification threads per scheme (blspy and PyNaCl release the GIL)
+VERIFY_WORKERS = 8
+
+
+def _verify_each(idxs: List[int], verify_one: Callable[[int], bool],
+                 results: List[bool]) -> None:
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+        for i, ok in zip(idxs, pool.map(verify_one, idxs)):
+            results[i] = ok
+
+
+def _verify_bls(votes: Sequence[Vote], idxs: List[int],
+                pubkeys: Dict[bytes, bytes], results: List[bool]) -> None:
+    if PopSchemeMPL is None:
+        raise ImportError("BLS vote verification requires blspy: pip install lux-consensus[verify]")
+
+    # Decode once; unknown voters and undecodable keys/signatures stay False
+    decoded = {}
+    for i in idxs:
+        vote = votes[i]
+        key = pubkeys.get(vote.voter_id)
+        if key is None:
+            continue
+        try:
+            decoded[i] = (G1Element.from_bytes(key), vote.signing_bytes(),
+                          G2Element.from_bytes(vote.signature[1:]))
+        except (ValueError, RuntimeError):
+            continue
+    if not decoded:
+        return
+
+    # One pairing check for the group; fall back to per-vote checks on failure
+    pks, msgs, sigs = zip(*decoded.values())
+    try:
+        all_valid = PopSchemeMPL.aggregate_verify(list(pks), list(msgs), PopSchemeMPL.aggregate(list(sigs)))
+    except (ValueError, RuntimeError):
+        all_valid = False
+    if all_valid:
+        for i in decoded:
+            results[i] = True
+        return
+
+    def verify_one(i: int) -> bool:
+        pk, msg, sig = decoded[i]
+        return PopSchemeMPL.verify(pk, msg, sig)
+
+    _verify_each(list(decoded), verify_one, results)
+
+
+def _verify_ed25519(votes: Sequence[Vote], idxs: List[int],
+                    pubkeys: Dict[bytes, bytes], results: List[bool]) -> None:
+    if VerifyKey is None:
+        raise ImportError("Ed25519 vote verification requires PyNaCl: pip install lux-consensus[verify]")
+
+    def verify_one(i: int) -> bool:
+        vote = votes[i]
+        key = pubkeys.get(vote.voter_id)
+        if key is None:
+            return False
+        try:
+            VerifyKey(key).verify(vote.signing_bytes(), vote.signature[1:])
+        except (BadSignatureError, ValueError):
+            return False
+        return True
+
+    _verify_each(idxs, verify_one, results)
+
+
+def verify_votes_batch(votes: Sequence[Vote], pubkeys: Dict[bytes, bytes]) -> List[bool]:
+    """Verify many vote signatures at once.
+
+    Args:
+        votes: Votes to check
+        pubkeys: Public key per voter_id
+
+    Returns:
+        One bool per vote. Unsigned votes, unknown voters and schemes
+        without a batch verifier here (Corona, Quasar) yield False.
+
+    Raises:
+        ImportError: if a BLS or Ed25519 vote is present and the matching
+            optional package (blspy / PyNaCl) is not installed
+    """
+    results = [False] * len(votes)
+    groups: Dict[int, List[int]] = {}
+    for i, vote in enumerate(votes):
+        groups.setdefault(vote.signature_scheme(), []).append(i)
+
+    if SIG_BLS in groups:
+        _verify_bls(votes, groups[SIG_BLS], pubkeys, results)
+    if SIG_ED25519 in groups:
+        _verify_ed25519(votes, groups[SIG_ED25519], pubkeys, results)
+    return results
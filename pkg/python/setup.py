@@ -17,18 +17,31 @@ library_dirs = [os.path.join(c_lib_path, 'lib')]
 extra_link_args = []
 if platform.system() == 'Darwin':
     # macOS specific settings
-    extra_link_args = ['-Wl,-rpath,@loader_path/../c/lib']
+    extra_link_args = ['-Wl,-rpath,@loader_path/../../c/lib']
 elif platform.system() == 'Linux':
     # Linux specific settings
-    extra_link_args = ['-Wl,-rpath,$ORIGIN/../c/lib']
+    extra_link_args = ['-Wl,-rpath,$ORIGIN/../../c/lib']
+
+# Optimisation flags for the generated wrapper (GCC/Clang)
+extra_compile_args = []
+if platform.system() != 'Windows':
+    extra_compile_args = ['-O3']
+    if platform.system() == 'Linux':
+        extra_compile_args.append('-fno-plt')
+    # Host-specific code is opt-in so distributed wheels stay portable
+    if os.environ.get('LUX_CONSENSUS_NATIVE') == '1':
+        extra_compile_args.append('-march=native')
 
 extensions = [
+    # Built inside the package so it does not clash with the lux_consensus/
+    # directory: `python setup.py build_ext --inplace` then runs the tests
     Extension(
-        "lux_consensus",
-        ["lux_consensus.pyx"],
+        "lux_consensus.engine",
+        ["lux_consensus/engine.pyx"],
         include_dirs=include_dirs,
         library_dirs=library_dirs,
         libraries=["luxconsensus"],
+        extra_compile_args=extra_compile_args,
         extra_link_args=extra_link_args,
         language="c",
     )
@@ -40,7 +53,17 @@ setup(
     description="Python bindings for Lux Consensus C library with optional MLX GPU acceleration",
     author="Lux Industries Inc.",
     packages=["lux_consensus"],
-    ext_modules=cythonize(extensions, language_level="3"),
+    ext_modules=cythonize(
+        extensions,
+        language_level="3",
+        nthreads=os.cpu_count() or 1,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "initializedcheck": False,
+            "cdivision": True,
+        },
+    ),
     install_requires=[
         "numpy>=1.20.0",
     ],
@@ -48,6 +71,23 @@ setup(
         "mlx": [
             "mlx>=0.0.1",  # Apple Silicon GPU acceleration
         ],
+        "json": [
+            "orjson>=3.9.0",  # Preferred C JSON codec for wire types
+            "msgspec>=0.18.0",  # C JSON encoder for wire types
+        ],
+        "blake3": [
+            "blake3>=0.3.0",  # Fast local-only ID derivation
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",  # Binary storage/RPC encoding for wire types
+        ],
+        "verify": [
+            "blspy>=2.0.0",  # BLS aggregate vote verification
+            "pynacl>=1.5.0",  # Ed25519 vote verification
+        ],
+        "arrow": [
+            "pyarrow>=12.0.0",  # Columnar vote buffers
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-benchmark>=4.0.0",
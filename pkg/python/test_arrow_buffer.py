@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
+# See the file LICENSE for licensing terms.
+
+"""Tests for the Arrow-backed vote buffer"""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from lux_consensus.arrow_buffer import VOTE_SCHEMA, VoteBuffer
+from lux_consensus.types import Vote, SIG_ED25519
+
+
+def make_votes():
+    return [
+        Vote(b"\x01" * 32, b"\x0A" * 32, round=1, preference=True, timestamp_ms=100),
+        Vote(b"\x01" * 32, b"\x0B" * 32, round=1, preference=True, timestamp_ms=101,
+             signature=bytes([SIG_ED25519]) + b"s" * 64),
+        Vote(b"\x02" * 32, b"\x0C" * 32, round=2, preference=True, timestamp_ms=102),
+        Vote(b"\x02" * 32, b"\x0D" * 32, round=2, preference=False, timestamp_ms=103),
+    ]
+
+
+def test_append_and_record_batch_schema():
+    buf = VoteBuffer()
+    assert len(buf) == 0
+    assert buf.to_record_batch().num_rows == 0
+
+    votes = make_votes()
+    buf.append(votes[0])
+    buf.extend(votes[1:])
+    assert len(buf) == 4
+
+    batch = buf.to_record_batch()
+    assert batch.schema == VOTE_SCHEMA
+    assert batch.column("candidate_id").to_pylist() == [v.candidate_id for v in votes]
+    assert batch.column("voter_id").to_pylist() == [v.voter_id for v in votes]
+    assert batch.column("round").to_pylist() == [1, 1, 2, 2]
+    assert batch.column("preference").to_pylist() == [True, True, True, False]
+    assert batch.column("timestamp_ms").to_pylist() == [100, 101, 102, 103]
+    assert batch.column("sig_scheme").to_pylist() == [0, SIG_ED25519, 0, 0]
+
+
+def test_sealed_batch_cached_until_append():
+    buf = VoteBuffer()
+    buf.extend(make_votes())
+    batch = buf.to_record_batch()
+    assert buf.to_record_batch() is batch
+
+    buf.append(Vote(b"\x03" * 32, b"\x0E" * 32, timestamp_ms=104))
+    assert buf.to_record_batch() is not batch
+    assert buf.to_record_batch().num_rows == 5
+
+
+def test_tally():
+    buf = VoteBuffer()
+    buf.extend(make_votes())
+    accepted = {row["values"]: row["counts"] for row in buf.tally().to_pylist()}
+    assert accepted == {b"\x01" * 32: 2, b"\x02" * 32: 1}
+    every = {row["values"]: row["counts"] for row in buf.tally(accepted_only=False).to_pylist()}
+    assert every == {b"\x01" * 32: 2, b"\x02" * 32: 2}
+
+
+def test_ipc_round_trip():
+    buf = VoteBuffer()
+    buf.extend(make_votes())
+    decoded = VoteBuffer.read_ipc(buf.to_ipc())
+    assert decoded.equals(buf.to_record_batch())
@@ -2,106 +2,78 @@
 # Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
 # See the file LICENSE for licensing terms.
 
+import gc
+import importlib.util
 import sys
 import time
-import threading
-import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from lux_consensus import (
-    ConsensusEngine, ConsensusConfig, Block, Vote, Stats,
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+import tracemalloc
+import weakref
+import numpy as np
+import pytest
+from lux_consensus.engine import (
+    ConsensusEngine, ConsensusConfig, Block, Vote, BLOCK_SOA_DTYPE,
     EngineType, ConsensusError, engine_type_string, error_string
 )
+from lux_consensus.types import Candidate, pack_candidates
 
 # Test categories matching Go, C, and Rust implementations
 NUM_TEST_CATEGORIES = 15
 
-class TestResults:
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.skipped = 0
-
-results = TestResults()
-
-def print_test_header(category, test_name):
-    """Print formatted test header"""
-    print(f"\n\033[1;33m=== {category}: {test_name} ===\033[0m")
-
-def assert_test(condition, test_name):
-    """Assert test condition and track results"""
-    global results
-    if condition:
-        print(f"\033[0;32m[PASS]\033[0m {test_name}")
-        results.passed += 1
-    else:
-        print(f"\033[0;31m[FAIL]\033[0m {test_name}")
-        results.failed += 1
-        raise AssertionError(f"Test failed: {test_name}")
+# ID i is bytes([i]) * 32; built once and indexed instead of re-allocated
+_VIDS = tuple(bytes([i]) * 32 for i in range(256))
+
+# Shared by every suite that uses the standard DAG parameters. ConsensusConfig
+# exposes read-only properties and the engine copies it, so sharing is safe.
+DAG_CONFIG_STD = ConsensusConfig(k=20, alpha=15, beta=20)
+
+# The performance suites use the pytest-benchmark fixture (the `dev` extra)
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark is not installed")
+
+# Block payloads for the memory suite, encoded once instead of per block
+_BLOCK_DATAS = tuple(f"Block data {j}".encode() for j in range(100))
 
 # 1. INITIALIZATION TESTS
 def test_initialization_suite():
-    print_test_header("INITIALIZATION", "Library Lifecycle")
-    
     # Test multiple init/cleanup cycles
-    for i in range(3):
-        try:
-            config = ConsensusConfig()
-            engine = ConsensusEngine(config)
-            assert_test(True, f"Initialize library cycle {i}")
-            del engine  # Cleanup happens automatically
-            assert_test(True, f"Cleanup library cycle {i}")
-        except Exception as e:
-            assert_test(False, f"Init/cleanup cycle {i}: {e}")
-    
+    for _ in range(3):
+        config = ConsensusConfig()
+        engine = ConsensusEngine(config)
+        del engine  # Cleanup happens automatically
+
     # Test error strings
-    assert_test(error_string(0) == "Success", "Error string for SUCCESS")
-    assert_test(error_string(-1) == "Invalid parameters", "Error string for INVALID_PARAMS")
+    assert error_string(0) == "Success"
+    assert error_string(-1) == "Invalid parameters"
 
 # 2. ENGINE CREATION TESTS
 def test_engine_creation_suite():
-    print_test_header("ENGINE", "Creation and Configuration")
-    
     # Test various configurations
     configs = [
-        ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                       engine_type=EngineType.CHAIN),
-        ConsensusConfig(k=30, alpha_preference=20, alpha_confidence=20, beta=25,
-                       concurrent_polls=2, optimal_processing=2, max_outstanding_items=2048,
-                       engine_type=EngineType.DAG),
-        ConsensusConfig(k=10, alpha_preference=7, alpha_confidence=7, beta=10,
-                       max_outstanding_items=512, max_item_processing_time_ns=1000000000,
-                       engine_type=EngineType.PQ),
+        ConsensusConfig(k=20, alpha=15, beta=20),
+        ConsensusConfig(node_count=50, k=30, alpha=20, beta=25),
+        ConsensusConfig(node_count=10, k=10, alpha=7, beta=10),
     ]
-    
-    for i, config in enumerate(configs):
-        try:
-            engine = ConsensusEngine(config)
-            assert_test(True, f"Create engine with config {i}")
-            del engine
-        except Exception as e:
-            assert_test(False, f"Create engine with config {i}: {e}")
-    
-    # Test invalid parameters
-    try:
-        # Python wrapper handles parameter validation differently
-        # k=0 might be accepted as an edge case, skip this test
-        config = ConsensusConfig(k=0)  # Edge case k value
+
+    for config in configs:
         engine = ConsensusEngine(config)
-        assert_test(True, "Config with k=0 handled as edge case")
-    except:
-        assert_test(True, "Reject invalid config")
+        del engine
+
+    # k=0 is an edge case: the engine may accept or reject it, but must not crash
+    try:
+        ConsensusEngine(ConsensusConfig(k=0))
+    except ConsensusError:
+        pass
 
 # 3. BLOCK MANAGEMENT TESTS
 def test_block_management_suite():
-    print_test_header("BLOCKS", "Add, Query, and Hierarchy")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
+    config = DAG_CONFIG_STD
     engine = ConsensusEngine(config)
-    
+
     # Create block hierarchy
     genesis_id = b'\x00' * 32
-    
+
     block1 = Block(
         block_id=b'\x01' * 32,
         parent_id=genesis_id,
@@ -109,48 +81,54 @@ def test_block_management_suite():
         timestamp=int(time.time()),
         data=b"Block 1 data"
     )
-    
+
     block2 = Block(
         block_id=b'\x02' * 32,
         parent_id=block1.id,
         height=2,
         timestamp=int(time.time())
     )
-    
-    # Test adding blocks
-    try:
-        engine.add_block(block1)
-        assert_test(True, "Add block 1")
-        
-        engine.add_block(block2)
-        assert_test(True, "Add block 2")
-        
-        # Test idempotency
-        engine.add_block(block1)
-        assert_test(True, "Add duplicate block (idempotent)")
-        
-        # Test with block data
-        block3 = Block(
-            block_id=b'\x03' * 32,
-            parent_id=block2.id,
-            height=3,
-            timestamp=int(time.time()),
-            data=b"Important block data"
-        )
-        engine.add_block(block3)
-        assert_test(True, "Add block with data")
-        
-    except Exception as e:
-        assert_test(False, f"Block management: {e}")
+
+    engine.add_block(block1)
+    engine.add_block(block2)
+
+    # Test idempotency
+    engine.add_block(block1)
+
+    # Test with block data
+    block3 = Block(
+        block_id=b'\x03' * 32,
+        parent_id=block2.id,
+        height=3,
+        timestamp=int(time.time()),
+        data=b"Important block data"
+    )
+    engine.add_block(block3)
+
+def test_add_blocks_soa_from_candidates():
+    candidates = [Candidate.new(b"soa", bytes([i]), i + 1) for i in range(64)]
+    ids, parent_ids, heights = pack_candidates(candidates)
+    assert ids.shape == parent_ids.shape == (64, 32) and heights.dtype == np.uint64
+
+    engine = ConsensusEngine(DAG_CONFIG_STD)
+    engine.add_blocks_soa(ids[:32], parent_ids[:32], heights[:32])
+    engine.add_blocks_soa(ids[32:], parent_ids[32:], heights[32:],
+                          np.full(32, 1_700_000_000, dtype=np.uint64))
+    # Every block was inserted; none is decided until votes arrive
+    assert not any(engine.is_accepted(c.id) for c in candidates)
+
+    # Mismatched columns are rejected before anything is inserted
+    with pytest.raises(ValueError):
+        engine.add_blocks_soa(ids, parent_ids[:-1], heights)
+    with pytest.raises(ValueError):
+        engine.add_blocks_soa(ids, parent_ids, heights, np.zeros(3, dtype=np.uint64))
+    engine.add_blocks_soa(*pack_candidates([]))
 
 # 4. VOTING TESTS
 def test_voting_suite():
-    print_test_header("VOTING", "Preference and Confidence")
-    
-    config = ConsensusConfig(k=20, alpha_preference=3, alpha_confidence=3, beta=5,
-                            engine_type=EngineType.DAG)
+    config = ConsensusConfig(k=20, alpha=3, beta=5)
     engine = ConsensusEngine(config)
-    
+
     # Add test block
     block = Block(
         block_id=b'\x0A' * 32,
@@ -159,39 +137,34 @@ def test_voting_suite():
         timestamp=int(time.time())
     )
     engine.add_block(block)
-    
+
     # Test preference votes
     for i in range(3):
         vote = Vote(
-            voter_id=bytes([i]) * 32,
+            voter_id=_VIDS[i],
             block_id=block.id,
             is_preference=True
         )
         engine.process_vote(vote)
-        assert_test(True, f"Process preference vote {i}")
-    
+
     # Test confidence votes
     for i in range(3, 6):
         vote = Vote(
-            voter_id=bytes([i]) * 32,
+            voter_id=_VIDS[i],
             block_id=block.id,
             is_preference=False
         )
         engine.process_vote(vote)
-        assert_test(True, f"Process confidence vote {i}")
-    
+
     # Check statistics
     stats = engine.get_stats()
-    assert_test(stats.votes_processed == 6, "Vote count tracking")
+    assert stats.votes_processed == 6, "Vote count tracking"
 
 # 5. ACCEPTANCE TESTS
 def test_acceptance_suite():
-    print_test_header("ACCEPTANCE", "Decision Thresholds")
-    
-    config = ConsensusConfig(k=20, alpha_preference=2, alpha_confidence=2, beta=3,
-                            engine_type=EngineType.DAG)
+    config = ConsensusConfig(k=20, alpha=2, beta=3)
     engine = ConsensusEngine(config)
-    
+
     # Add competing blocks
     block_a = Block(
         block_id=b'\xAA' * 32,
@@ -200,7 +173,7 @@ def test_acceptance_suite():
         timestamp=int(time.time())
     )
     engine.add_block(block_a)
-    
+
     block_b = Block(
         block_id=b'\xBB' * 32,
         parent_id=b'\x00' * 32,
@@ -208,36 +181,28 @@ def test_acceptance_suite():
         timestamp=int(time.time())
     )
     engine.add_block(block_b)
-    
+
     # Vote for block A to reach acceptance
     for i in range(3):
         vote = Vote(
-            voter_id=bytes([i]) * 32,
+            voter_id=_VIDS[i],
             block_id=block_a.id,
             is_preference=False
         )
         engine.process_vote(vote)
-    
+
     # Check acceptance
-    is_accepted_a = engine.is_accepted(block_a.id)
-    assert_test(is_accepted_a == True, "Block A accepted after threshold")
-    
-    is_accepted_b = engine.is_accepted(block_b.id)
-    assert_test(is_accepted_b == False, "Block B not accepted")
+    assert engine.is_accepted(block_a.id), "Block A accepted after threshold"
+    assert not engine.is_accepted(block_b.id), "Block B not accepted"
 
 # 6. PREFERENCE TESTS
 def test_preference_suite():
-    print_test_header("PREFERENCE", "Preferred Block Selection")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
+    config = DAG_CONFIG_STD
     engine = ConsensusEngine(config)
-    
+
     # Initial preference should be genesis
-    pref_id = engine.get_preference()
-    is_genesis = all(b == 0 for b in pref_id)
-    assert_test(is_genesis, "Initial preference is genesis")
-    
+    assert engine.get_preference() == b'\x00' * 32, "Initial preference is genesis"
+
     # Add and accept a block
     block = Block(
         block_id=b'\xFF' * 32,
@@ -246,62 +211,51 @@ def test_preference_suite():
         timestamp=int(time.time())
     )
     engine.add_block(block)
-    
+
     # Vote to accept
     for i in range(20):
         vote = Vote(
-            voter_id=bytes([i]) * 32,
+            voter_id=_VIDS[i],
             block_id=block.id,
             is_preference=False
         )
         engine.process_vote(vote)
-    
+
     # Check preference updated
-    pref_id = engine.get_preference()
-    assert_test(pref_id == block.id, "Preference updated to accepted block")
+    assert engine.get_preference() == block.id, "Preference updated to accepted block"
 
 # 7. POLLING TESTS
-def test_polling_suite():
-    print_test_header("POLLING", "Validator Polling")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
-    engine = ConsensusEngine(config)
-    
+def test_polling_suite(dag_engine):
+    engine = dag_engine
+
     # Create validator IDs
-    validators = [bytes([i + 100]) * 32 for i in range(10)]
-    
+    validators = [_VIDS[i + 100] for i in range(10)]
+
     # Test polling
-    try:
-        engine.poll(validators)
-        assert_test(True, "Poll 10 validators")
-        
-        # Test with no validators
+    engine.poll(validators)
+
+    # An empty poll is rejected and not counted
+    with pytest.raises(ConsensusError):
         engine.poll([])
-        assert_test(True, "Poll with no validators")
-        
-        # Check stats
-        stats = engine.get_stats()
-        assert_test(stats.polls_completed == 2, "Poll count tracking")
-        
-    except Exception as e:
-        assert_test(False, f"Polling failed: {e}")
+
+    # Check stats
+    stats = engine.get_stats()
+    assert stats.polls_completed == 1, "Poll count tracking"
 
 # 8. STATISTICS TESTS
-def test_statistics_suite():
-    print_test_header("STATISTICS", "Metrics Collection")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
-    engine = ConsensusEngine(config)
-    
+def test_statistics_suite(dag_engine):
+    engine = dag_engine
+
     # Initial stats
     stats = engine.get_stats()
-    assert_test(stats.blocks_accepted == 0, "Initial blocks accepted")
-    assert_test(stats.blocks_rejected == 0, "Initial blocks rejected")
-    assert_test(stats.polls_completed == 0, "Initial polls completed")
-    assert_test(stats.votes_processed == 0, "Initial votes processed")
-    
+    assert stats.blocks_accepted == 0, "Initial blocks accepted"
+    assert stats.blocks_rejected == 0, "Initial blocks rejected"
+    assert stats.polls_completed == 0, "Initial polls completed"
+    assert stats.votes_processed == 0, "Initial votes processed"
+
+    # Nothing changed, so the snapshot is reused
+    assert engine.get_stats() is stats
+
     # Generate activity
     block = Block(
         block_id=b'\x42' * 32,
@@ -310,366 +264,312 @@ def test_statistics_suite():
         timestamp=int(time.time())
     )
     engine.add_block(block)
-    
+
     for i in range(5):
         vote = Vote(
-            voter_id=bytes([i]) * 32,
+            voter_id=_VIDS[i],
             block_id=block.id,
             is_preference=(i % 2 == 0)
         )
         engine.process_vote(vote)
-    
+
     # Check updated stats
+    assert engine.get_stats() is not stats, "Votes invalidate the snapshot"
     stats = engine.get_stats()
-    assert_test(stats.votes_processed == 5, "Updated votes processed")
-    assert_test(repr(stats).startswith("Stats("), "Stats representation")
+    assert stats.votes_processed == 5, "Updated votes processed"
+    assert engine.get_stats() is stats
+    assert repr(stats).startswith("Stats(")
 
 # 9. THREAD SAFETY TESTS
 def test_thread_safety_suite():
-    print_test_header("CONCURRENCY", "Thread Safety")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
+    config = DAG_CONFIG_STD
     engine = ConsensusEngine(config)
-    
+
+    # The vote threads target these blocks, so every vote must succeed
+    for i in range(10):
+        engine.add_block(Block(
+            block_id=_VIDS[i],
+            parent_id=b'\x00' * 32,
+            height=1,
+            timestamp=int(time.time())
+        ))
+    votes_before = engine.get_stats().votes_processed
+
     def add_blocks_thread(thread_id):
+        # One ID buffer per thread, rewritten in place: [thread_id, i, 0...]
+        buf = bytearray(32)
+        buf[0] = thread_id
         for i in range(100):
+            buf[1] = i
             block = Block(
-                block_id=bytes([thread_id, i]) + b'\x00' * 30,
+                block_id=bytes(buf),
                 parent_id=b'\x00' * 32,
                 height=i,
                 timestamp=int(time.time())
             )
-            try:
-                engine.add_block(block)
-            except:
-                pass
-    
+            engine.add_block(block)
+
     def process_votes_thread(thread_id):
+        buf = bytearray(32)
+        buf[0] = thread_id
         for i in range(100):
+            buf[1] = i
             vote = Vote(
-                voter_id=bytes([thread_id, i]) + b'\x00' * 30,
-                block_id=bytes([i % 10]) * 32,
+                voter_id=bytes(buf),
+                block_id=_VIDS[i % 10],
                 is_preference=(i % 2 == 0)
             )
-            try:
-                engine.process_vote(vote)
-            except:
-                pass
-    
-    # Create threads
-    threads = []
-    for i in range(2):
-        t = threading.Thread(target=add_blocks_thread, args=(i,))
-        threads.append(t)
-        t.start()
-    
-    for i in range(2):
-        t = threading.Thread(target=process_votes_thread, args=(i + 2,))
-        threads.append(t)
-        t.start()
-    
-    # Wait for completion
-    for t in threads:
-        t.join()
-    
+            engine.process_vote(vote)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = ([executor.submit(add_blocks_thread, i) for i in range(2)] +
+                   [executor.submit(process_votes_thread, i + 2) for i in range(2)])
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        # Re-raise the first worker failure instead of hiding it
+        for future in done:
+            future.result()
+
     # Check consistency
     stats = engine.get_stats()
-    assert_test(stats.votes_processed > 0, "Concurrent vote processing")
+    assert stats.votes_processed - votes_before == 200, "Concurrent vote processing"
+
+def test_submit_during_flush():
+    engine = ConsensusEngine(DAG_CONFIG_STD)
+    engine.add_block(Block(_VIDS[1], b'\x00' * 32, 1, int(time.time())))
+    votes_before = engine.get_stats().votes_processed
+
+    def submit_votes(thread_id):
+        for i in range(500):
+            engine.submit_vote_nowait(Vote(_VIDS[thread_id], _VIDS[1], i % 2 == 0))
+
+    # Flush repeatedly while producers submit; no vote may be stranded
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(submit_votes, i) for i in range(4)]
+        while not all(f.done() for f in futures):
+            engine.flush_votes()
+        for future in futures:
+            future.result()
+    engine.flush_votes()
+    assert engine.get_stats().votes_processed - votes_before == 4 * 500
+
+    # An idle consumer must not keep the engine alive
+    engine.submit_vote_nowait(Vote(_VIDS[0], _VIDS[1], True))
+    deadline = time.monotonic() + 5
+    while engine.get_stats().votes_processed - votes_before < 4 * 500 + 1:
+        assert time.monotonic() < deadline, "Queued vote never applied"
+        time.sleep(0.001)
+    engine_ref = weakref.ref(engine)
+    del engine
+    gc.collect()
+    assert engine_ref() is None, "Vote consumer kept the engine alive"
 
 # 10. MEMORY MANAGEMENT TESTS
+@pytest.mark.slow
 def test_memory_management_suite():
-    print_test_header("MEMORY", "Allocation and Cleanup")
-    
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
     # Test multiple engine creation/destruction
     for _ in range(10):
-        config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                                engine_type=EngineType.DAG)
+        config = DAG_CONFIG_STD
         engine = ConsensusEngine(config)
-        
+
         # Add many blocks
         for j in range(100):
-            data = f"Block data {j}".encode()
+            data = _BLOCK_DATAS[j]
             block = Block(
-                block_id=bytes([j]) * 32,
+                block_id=_VIDS[j],
                 parent_id=b'\x00' * 32,
                 height=j,
                 timestamp=int(time.time()),
                 data=data
             )
             engine.add_block(block)
-        
+
         # Engine will be garbage collected
         del engine
-    
-    assert_test(True, "Memory stress test passed")
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    assert growth < 50_000_000, f"Memory growth unbounded ({growth} bytes)"
 
 # 11. ERROR HANDLING TESTS
 def test_error_handling_suite():
-    print_test_header("ERRORS", "Error Conditions")
-    
     # Test invalid block ID length
-    try:
-        block = Block(
+    with pytest.raises(ValueError, match="32 bytes"):
+        Block(
             block_id=b'\x01' * 16,  # Wrong length
             parent_id=b'\x00' * 32,
             height=1
         )
-        assert_test(False, "Should reject invalid block ID length")
-    except ValueError as e:
-        assert_test("32 bytes" in str(e), "Catch invalid block ID length")
-    
+
     # Test invalid vote
-    try:
-        vote = Vote(
+    with pytest.raises(ValueError, match="32 bytes"):
+        Vote(
             voter_id=b'\x01' * 16,  # Wrong length
             block_id=b'\x00' * 32,
             is_preference=True
         )
-        assert_test(False, "Should reject invalid voter ID length")
-    except ValueError as e:
-        assert_test("32 bytes" in str(e), "Catch invalid voter ID length")
-    
-    # Test ConsensusError
+
+    # Checking a non-existent block may either succeed or raise ConsensusError
+    config = ConsensusConfig()
+    engine = ConsensusEngine(config)
     try:
-        # This would trigger an error in actual usage
-        config = ConsensusConfig()
-        engine = ConsensusEngine(config)
-        # Force an error by checking non-existent block
-        is_accepted = engine.is_accepted(b'\xFF' * 32)
-        # If no error, that's also OK
-        assert_test(True, "Error handling for non-existent block")
-    except ConsensusError as e:
-        assert_test(True, f"ConsensusError raised: {e}")
+        engine.is_accepted(b'\xFF' * 32)
+    except ConsensusError:
+        pass
 
 # 12. ENGINE TYPE TESTS
 def test_engine_types_suite():
-    print_test_header("ENGINE TYPES", "Chain, DAG, PQ")
-    
     types_and_names = [
         (EngineType.CHAIN, "Chain"),
         (EngineType.DAG, "DAG"),
         (EngineType.PQ, "PQ"),
     ]
-    
+
     for engine_type, expected_name in types_and_names:
-        config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                                engine_type=engine_type)
-        try:
-            engine = ConsensusEngine(config)
-            assert_test(True, f"Create {expected_name} engine")
-            
-            type_str = engine_type_string(engine_type)
-            assert_test(type_str == expected_name, f"Engine type string for {expected_name}")
-            
-            del engine
-        except Exception as e:
-            assert_test(False, f"Engine type {expected_name}: {e}")
+        assert engine_type_string(engine_type) == expected_name
 
 # 13. PERFORMANCE TESTS
-def test_performance_suite():
-    print_test_header("PERFORMANCE", "Throughput and Latency")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
-    engine = ConsensusEngine(config)
-    
-    # Add 1000 blocks
-    start_time = time.time()
-    
-    for i in range(1000):
-        block_id = bytes([i >> 8, i & 0xFF]) + b'\x00' * 30
-        block = Block(
-            block_id=block_id,
-            parent_id=b'\x00' * 32,
-            height=i,
-            timestamp=int(time.time())
-        )
-        engine.add_block(block)
-    
-    elapsed = time.time() - start_time
-    assert_test(elapsed < 1.0, f"Add 1000 blocks in < 1 second (took {elapsed:.3f}s)")
-    print(f"  Time: {elapsed:.3f} seconds")
-    
-    # Process 10000 votes
-    start_time = time.time()
-    
+def _performance_engine():
+    return ConsensusEngine(DAG_CONFIG_STD)
+
+def _performance_blocks():
+    # One packed buffer instead of 1000 Block objects: block i has ID [i >> 8, i & 0xFF, 0...]
+    index = np.arange(1000)
+    blocks = np.zeros(1000, dtype=BLOCK_SOA_DTYPE)
+    blocks['id'][:, 0] = index >> 8
+    blocks['id'][:, 1] = index & 0xFF
+    blocks['height'] = index
+    blocks['ts'] = int(time.time())
+    return blocks
+
+@requires_benchmark
+def test_add_1000_blocks(benchmark):
+    blocks = _performance_blocks()
+
+    def add_blocks(engine):
+        engine.add_blocks(blocks)
+
+    # Fresh engine per round so every round inserts 1000 new blocks
+    benchmark.pedantic(add_blocks, setup=lambda: ((_performance_engine(),), {}), rounds=5)
+
+@requires_benchmark
+def test_process_10000_votes(benchmark):
+    blocks = _performance_blocks()
+    votes = []
+    voter_buf = bytearray(32)
+    block_buf = bytearray(32)
     for i in range(10000):
-        voter_id = bytes([i >> 8, i & 0xFF]) + b'\x00' * 30
+        voter_buf[0] = i >> 8
+        voter_buf[1] = i & 0xFF
         # Vote for blocks that actually exist (we added 1000 blocks)
         block_index = i % 1000
-        block_id = bytes([block_index >> 8, block_index & 0xFF]) + b'\x00' * 30
-        vote = Vote(
-            voter_id=voter_id,
-            block_id=block_id,
+        block_buf[0] = block_index >> 8
+        block_buf[1] = block_index & 0xFF
+        votes.append(Vote(
+            voter_id=bytes(voter_buf),
+            block_id=bytes(block_buf),
             is_preference=(i % 2 == 0)
-        )
-        engine.process_vote(vote)
-    
-    elapsed = time.time() - start_time
-    assert_test(elapsed < 2.0, f"Process 10000 votes in < 2 seconds (took {elapsed:.3f}s)")
-    print(f"  Time: {elapsed:.3f} seconds")
+        ))
+
+    def engine_with_blocks():
+        engine = _performance_engine()
+        engine.add_blocks(blocks)
+        return (engine,), {}
+
+    # One native call and one lock acquisition for the whole batch
+    def process_votes(engine):
+        engine.process_votes_parallel(votes)
+
+    benchmark.pedantic(process_votes, setup=engine_with_blocks, rounds=5)
 
 # 14. EDGE CASE TESTS
 def test_edge_cases_suite():
-    print_test_header("EDGE CASES", "Boundary Conditions")
-    
     # Minimum configuration
-    min_config = ConsensusConfig(k=1, alpha_preference=1, alpha_confidence=1, beta=1,
-                                concurrent_polls=1, optimal_processing=1,
-                                max_outstanding_items=1, max_item_processing_time_ns=1,
-                                engine_type=EngineType.CHAIN)
-    try:
-        engine = ConsensusEngine(min_config)
-        assert_test(True, "Minimum configuration")
-        del engine
-    except Exception as e:
-        assert_test(False, f"Minimum configuration: {e}")
-    
+    min_config = ConsensusConfig(node_count=1, k=1, alpha=1, beta=1)
+    engine = ConsensusEngine(min_config)
+    del engine
+
     # Maximum reasonable configuration
-    max_config = ConsensusConfig(k=1000, alpha_preference=750, alpha_confidence=750, beta=900,
-                                concurrent_polls=100, optimal_processing=100,
-                                max_outstanding_items=1000000,
-                                max_item_processing_time_ns=10000000000,
-                                engine_type=EngineType.DAG)
-    try:
-        engine = ConsensusEngine(max_config)
-        
-        # Very long block chain
-        for i in range(100):
-            parent_id = b'\x00' * 32 if i == 0 else bytes([i - 1]) * 32
-            block = Block(
-                block_id=bytes([i]) * 32,
-                parent_id=parent_id,
-                height=i,
-                timestamp=int(time.time())
-            )
-            engine.add_block(block)
-        
-        assert_test(True, "Long chain creation")
-        del engine
-    except Exception as e:
-        assert_test(False, f"Maximum configuration: {e}")
+    max_config = ConsensusConfig(node_count=1000, k=1000, alpha=750, beta=900)
+    engine = ConsensusEngine(max_config)
+
+    # Very long block chain
+    for i in range(100):
+        parent_id = b'\x00' * 32 if i == 0 else _VIDS[i - 1]
+        block = Block(
+            block_id=_VIDS[i],
+            parent_id=parent_id,
+            height=i,
+            timestamp=int(time.time())
+        )
+        engine.add_block(block)
+
+    del engine
 
 # 15. INTEGRATION TESTS
 def test_integration_suite():
-    print_test_header("INTEGRATION", "Full Workflow")
-    
-    config = ConsensusConfig(k=20, alpha_preference=15, alpha_confidence=15, beta=20,
-                            engine_type=EngineType.DAG)
+    config = DAG_CONFIG_STD
     engine = ConsensusEngine(config)
-    
+
     # Simulate full consensus workflow
     # 1. Add genesis
     genesis_id = b'\x00' * 32
-    
+
     # 2. Add competing chains
     chain_a = []
     chain_b = []
-    
+
     for i in range(5):
         # Chain A
         if i == 0:
             parent_id = genesis_id
         else:
             parent_id = chain_a[i - 1].id
-        
+
         block_a = Block(
-            block_id=bytes([0xA0 + i]) * 32,
+            block_id=_VIDS[0xA0 + i],
             parent_id=parent_id,
             height=i + 1,
             timestamp=int(time.time())
         )
         engine.add_block(block_a)
         chain_a.append(block_a)
-        
+
         # Chain B
         if i == 0:
             parent_id = genesis_id
         else:
             parent_id = chain_b[i - 1].id
-        
+
         block_b = Block(
-            block_id=bytes([0xB0 + i]) * 32,
+            block_id=_VIDS[0xB0 + i],
             parent_id=parent_id,
             height=i + 1,
             timestamp=int(time.time())
         )
         engine.add_block(block_b)
         chain_b.append(block_b)
-    
+
     # 3. Vote for chain A
     for i in range(20):
         vote = Vote(
-            voter_id=bytes([i]) * 32,
+            voter_id=_VIDS[i],
             block_id=chain_a[4].id,
             is_preference=False
         )
         engine.process_vote(vote)
-    
+
     # 4. Check final state
-    is_accepted_a = engine.is_accepted(chain_a[4].id)
-    assert_test(is_accepted_a, "Chain A accepted")
-    
-    is_accepted_b = engine.is_accepted(chain_b[4].id)
-    assert_test(not is_accepted_b, "Chain B rejected")
-    
-    pref_id = engine.get_preference()
-    assert_test(pref_id == chain_a[4].id, "Preference is chain A tip")
-    
+    assert engine.is_accepted(chain_a[4].id), "Chain A accepted"
+    assert not engine.is_accepted(chain_b[4].id), "Chain B rejected"
+    assert engine.get_preference() == chain_a[4].id, "Preference is chain A tip"
+
     stats = engine.get_stats()
-    assert_test(stats.blocks_accepted > 0, "Blocks accepted in workflow")
-    assert_test(stats.votes_processed == 20, "All votes processed")
-
-# Main test runner
-def main():
-    print("\033[1;33m=====================================")
-    print("=== LUX CONSENSUS PYTHON TEST SUITE ===")
-    print("=====================================\033[0m\n")
-    
-    # Run all test suites
-    test_suites = [
-        test_initialization_suite,
-        test_engine_creation_suite,
-        test_block_management_suite,
-        test_voting_suite,
-        test_acceptance_suite,
-        test_preference_suite,
-        test_polling_suite,
-        test_statistics_suite,
-        test_thread_safety_suite,
-        test_memory_management_suite,
-        test_error_handling_suite,
-        test_engine_types_suite,
-        test_performance_suite,
-        test_edge_cases_suite,
-        test_integration_suite,
-    ]
-    
-    for test_suite in test_suites:
-        try:
-            test_suite()
-        except Exception as e:
-            print(f"\033[0;31mTest suite failed: {e}\033[0m")
-            results.failed += 1
-    
-    # Print summary
-    print("\n\033[1;33m=====================================")
-    print("=== TEST SUMMARY ===")
-    print("=====================================\033[0m")
-    
-    total_tests = results.passed + results.failed + results.skipped
-    print(f"Total Tests: {total_tests}")
-    print(f"\033[0;32mPassed: {results.passed}\033[0m")
-    print(f"\033[0;31mFailed: {results.failed}\033[0m")
-    print(f"\033[1;33mSkipped: {results.skipped}\033[0m")
-    
-    if results.failed == 0:
-        print(f"\n\033[0;32m🎉 ALL TESTS PASSED! 100% SUCCESS RATE\033[0m")
-        return 0
-    else:
-        print(f"\n\033[0;31m❌ SOME TESTS FAILED\033[0m")
-        return 1
+    assert stats.blocks_accepted > 0, "Blocks accepted in workflow"
+    assert stats.votes_processed == 20, "All votes processed"
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-q", "-p", "no:cacheprovider", "--tb=short"]))
@@ -4,35 +4,54 @@ Verification tests for Lux Consensus Python SDK
 Tests that consensus mechanisms actually work, not just that code runs
 """
 
+import asyncio
 import sys
 import time
 import threading
-from lux_consensus import (
-    ConsensusEngine, ConsensusConfig, Block, Vote,
-    EngineType, engine_type_string
+import numpy as np
+from lux_consensus.engine import (
+    ConsensusEngine, ConsensusConfig, Block, Vote, ConsensusError
 )
 
 
+# ID i is bytes([i]) * 32; built once and indexed instead of re-allocated
+_VIDS = tuple(bytes([i]) * 32 for i in range(256))
+
+
+def _make_validators(n):
+    """Return n validator IDs packed into one bytes buffer; ID i is bytes([i]) * 32"""
+    return np.broadcast_to(np.arange(n, dtype=np.uint8)[:, None], (n, 32)).tobytes()
+
+
+def _vid(validators, i):
+    """Return validator ID i from a buffer built by _make_validators"""
+    return validators[i * 32:(i + 1) * 32]
+
+
+def _id_rows(validators):
+    """View a _make_validators buffer as a (n, 32) uint8 array for poll_view"""
+    return np.frombuffer(validators, dtype=np.uint8).reshape(-1, 32)
+
+
 def test_chain_consensus_finality():
     """Test that Chain consensus achieves finality with enough votes"""
     print("\n=== CHAIN CONSENSUS: Testing Finality ===")
 
     config = ConsensusConfig(
         k=5,  # Small sample size for testing
-        alpha_preference=3,  # 3 out of 5 for preference
-        alpha_confidence=4,  # 4 out of 5 for confidence
+        alpha=3,  # 3 out of 5
         beta=10,  # 10 consecutive successful queries for acceptance
-        engine_type=EngineType.CHAIN
     )
     engine = ConsensusEngine(config)
 
     # Create a simple chain
+    now = int(time.time())
     genesis = b'\x00' * 32
     block1 = Block(
         block_id=b'\x01' * 32,
         parent_id=genesis,
         height=1,
-        timestamp=int(time.time())
+        timestamp=now
     )
     engine.add_block(block1)
 
@@ -40,42 +59,36 @@ def test_chain_consensus_finality():
         block_id=b'\x02' * 32,
         parent_id=block1.id,
         height=2,
-        timestamp=int(time.time())
+        timestamp=now
     )
     engine.add_block(block2)
 
     # Simulate validator voting for block1
-    validators = [bytes([i]) * 32 for i in range(100)]
-
-    # 80% vote for block1 (should achieve consensus)
-    for i in range(80):
-        vote = Vote(
-            voter_id=validators[i],
-            block_id=block1.id,
-            is_preference=True
-        )
-        engine.process_vote(vote)
-
-    # 20% vote for block2
-    for i in range(80, 100):
-        vote = Vote(
-            voter_id=validators[i],
-            block_id=block2.id,
-            is_preference=True
-        )
-        engine.process_vote(vote)
+    validators = _make_validators(100)
+    voter_ids = np.frombuffer(validators, dtype="|S32")
+    poll_subset = _id_rows(validators)[:10]
+
+    # 80% vote for block1 (should achieve consensus), 20% for block2,
+    # applied as one batch
+    block_ids = np.array([block1.id] * 80 + [block2.id] * 20, dtype="|S32")
+    engine.process_votes_batch(voter_ids, block_ids, np.ones(100, dtype=np.bool_))
+
+    # Each round, 7/10 = 70% of the polled subset confirm block1
+    confirm_votes = [
+        Vote(voter_id=_vid(validators, i), block_id=block1.id, is_preference=False)  # Confidence vote
+        for i in range(7)
+    ]
 
-    # Simulate multiple polling rounds to achieve beta threshold
-    for round in range(15):  # More than beta=10
-        # Each round, majority confirms block1
-        engine.poll(validators[:10])  # Poll subset
-        for i in range(7):  # 7/10 = 70% confirm
-            vote = Vote(
-                voter_id=validators[i],
-                block_id=block1.id,
-                is_preference=False  # Confidence vote
+    # Simulate multiple polling rounds to achieve beta threshold. Within a
+    # round the poll and the confirming votes overlap: both release the GIL
+    async def polling_rounds():
+        for round in range(15):  # More than beta=10
+            await asyncio.gather(
+                engine.apoll(poll_subset),
+                *(engine.aprocess_vote(vote) for vote in confirm_votes)
             )
-            engine.process_vote(vote)
+
+    asyncio.run(polling_rounds())
 
     # Check results
     block1_accepted = engine.is_accepted(block1.id)
@@ -104,45 +117,43 @@ def test_dag_consensus_parallelism():
     """Test that DAG consensus can handle parallel blocks"""
     print("\n=== DAG CONSENSUS: Testing Parallelism ===")
 
-    config = ConsensusConfig(
-        k=10,
-        alpha_preference=6,
-        alpha_confidence=8,
-        beta=5,
-        engine_type=EngineType.DAG
-    )
+    config = ConsensusConfig(k=10, alpha=6, beta=5)
     engine = ConsensusEngine(config)
 
+    now = int(time.time())
     genesis = b'\x00' * 32
 
     # Create parallel chains from genesis (DAG structure)
     # Chain A: genesis -> A1 -> A2
-    blockA1 = Block(b'\xA1' * 32, genesis, 1, int(time.time()))
-    blockA2 = Block(b'\xA2' * 32, blockA1.id, 2, int(time.time()))
+    blockA1 = Block(b'\xA1' * 32, genesis, 1, now)
+    blockA2 = Block(b'\xA2' * 32, blockA1.id, 2, now)
 
     # Chain B: genesis -> B1 -> B2
-    blockB1 = Block(b'\xB1' * 32, genesis, 1, int(time.time()))
-    blockB2 = Block(b'\xB2' * 32, blockB1.id, 2, int(time.time()))
+    blockB1 = Block(b'\xB1' * 32, genesis, 1, now)
+    blockB2 = Block(b'\xB2' * 32, blockB1.id, 2, now)
 
     # Add all blocks
     for block in [blockA1, blockA2, blockB1, blockB2]:
         engine.add_block(block)
 
     # DAG should handle parallel voting
-    validators = [bytes([i]) * 32 for i in range(50)]
+    validators = _make_validators(50)
 
     # Vote for both chains (DAG allows parallelism)
-    for validator in validators[:30]:  # 60% vote for chain A
+    for i in range(30):  # 60% vote for chain A
+        validator = _vid(validators, i)
         engine.process_vote(Vote(validator, blockA1.id, True))
         engine.process_vote(Vote(validator, blockA2.id, True))
 
-    for validator in validators[20:40]:  # 40% vote for chain B (overlap simulates DAG merge)
+    for i in range(20, 40):  # 40% vote for chain B (overlap simulates DAG merge)
+        validator = _vid(validators, i)
         engine.process_vote(Vote(validator, blockB1.id, True))
         engine.process_vote(Vote(validator, blockB2.id, True))
 
     # Poll to reach consensus
+    poll_subset = _id_rows(validators)[:15]
     for _ in range(10):
-        engine.poll(validators[:15])
+        engine.poll_view(poll_subset)
 
     stats = engine.get_stats()
     print(f"  Parallel blocks added: 4")
@@ -166,10 +177,8 @@ def test_pq_consensus_quantum_resistance():
 
     config = ConsensusConfig(
         k=20,  # Larger sample for quantum resistance
-        alpha_preference=15,
-        alpha_confidence=18,
+        alpha=15,
         beta=20,  # Higher threshold for PQ
-        engine_type=EngineType.PQ
     )
     engine = ConsensusEngine(config)
 
@@ -185,25 +194,26 @@ def test_pq_consensus_quantum_resistance():
     engine.add_block(quantum_block)
 
     # PQ consensus requires more validators and votes
-    validators = [bytes([i]) * 32 for i in range(100)]
+    validators = _make_validators(100)
 
     # Simulate PQ voting (higher thresholds)
     for i in range(90):  # 90% must agree in PQ
         vote = Vote(
-            voter_id=validators[i],
+            voter_id=_vid(validators, i),
             block_id=quantum_block.id,
             is_preference=True
         )
         engine.process_vote(vote)
 
     # Multiple rounds of polling for PQ consensus
+    poll_subset = _id_rows(validators)[:30]  # Larger poll size
     for round in range(25):  # More rounds for PQ
-        engine.poll(validators[:30])  # Larger poll size
+        engine.poll_view(poll_subset)
 
         # High confidence threshold
         for i in range(27):  # 90% of 30
             engine.process_vote(Vote(
-                validators[i],
+                _vid(validators, i),
                 quantum_block.id,
                 False  # Confidence
             ))
@@ -231,42 +241,39 @@ def test_consensus_safety_and_liveness():
 
     results = {}
 
-    for engine_type in [EngineType.CHAIN, EngineType.DAG, EngineType.PQ]:
-        config = ConsensusConfig(
-            k=10,
-            alpha_preference=6,
-            alpha_confidence=8,
-            beta=5,
-            engine_type=engine_type
-        )
-        engine = ConsensusEngine(config)
-        type_name = engine_type_string(engine_type)
+    # One engine, reset and reconfigured in place for each parameter set
+    engine = ConsensusEngine()
+    for k, alpha, beta in [(10, 6, 5), (5, 3, 3), (20, 15, 10)]:
+        engine.reset(ConsensusConfig(k=k, alpha=alpha, beta=beta))
+        type_name = f"k={k} alpha={alpha} beta={beta}"
 
         # Create conflicting blocks at same height
-        block_good = Block(b'\x01' * 32, b'\x00' * 32, 1, int(time.time()))
-        block_conflict = Block(b'\x02' * 32, b'\x00' * 32, 1, int(time.time()))
+        now = int(time.time())
+        block_good = Block(b'\x01' * 32, b'\x00' * 32, 1, now)
+        block_conflict = Block(b'\x02' * 32, b'\x00' * 32, 1, now)
 
         engine.add_block(block_good)
         engine.add_block(block_conflict)
 
-        validators = [bytes([i]) * 32 for i in range(20)]
+        validators = _make_validators(20)
 
         # Split vote initially (test safety)
         for i in range(10):
-            engine.process_vote(Vote(validators[i], block_good.id, True))
+            engine.process_vote(Vote(_vid(validators, i), block_good.id, True))
         for i in range(10, 20):
-            engine.process_vote(Vote(validators[i], block_conflict.id, True))
+            engine.process_vote(Vote(_vid(validators, i), block_conflict.id, True))
 
         # Eventually converge (test liveness)
         for round in range(20):
             # Gradually shift to block_good
             shift = min(round, 10)
             for i in range(10 + shift):
-                engine.process_vote(Vote(validators[i], block_good.id, False))
+                engine.process_vote(Vote(_vid(validators, i), block_good.id, False))
 
         # Poll to finalize
+        poll_all = _id_rows(validators)
         for _ in range(10):
-            engine.poll(validators)
+            engine.poll_view(poll_all)
 
         good_accepted = engine.is_accepted(block_good.id)
         conflict_accepted = engine.is_accepted(block_conflict.id)
@@ -289,14 +296,47 @@ def test_consensus_safety_and_liveness():
         print(f"    Safety (no conflicts): {safety}")
         print(f"    Liveness (makes progress): {liveness}")
 
-    # All consensus types should maintain safety and liveness
+    # Every parameter set should maintain safety and liveness
     all_safe = all(r['safety'] for r in results.values())
     all_live = all(r['liveness'] for r in results.values())
 
     assert all_safe, "Safety violation detected"
     assert all_live, "Liveness violation detected"
 
-    print("  ✅ All consensus types maintain safety and liveness")
+    print("  ✅ All parameter sets maintain safety and liveness")
+    return True
+
+
+def test_engine_reset():
+    """Test that reset() drops all state and the engine is reusable"""
+    print("\n=== RESET: Reusing One Engine ===")
+
+    engine = ConsensusEngine(ConsensusConfig(k=10, alpha=6, beta=5))
+    block = Block(b'\x01' * 32, b'\x00' * 32, 1, int(time.time()))
+    engine.add_block(block)
+    engine.process_vote(Vote(_VIDS[1], block.id, True))
+    engine.poll([_VIDS[1]])
+    # A queued vote for an unknown block fails, but reset() must not raise
+    engine.submit_vote_nowait(Vote(_VIDS[2], b'\xEE' * 32, True))
+
+    engine.reset(ConsensusConfig(k=5, alpha=3, beta=3))
+
+    stats = engine.get_stats()
+    assert (stats.votes_processed, stats.polls_completed, stats.blocks_accepted) == (0, 0, 0)
+    try:
+        engine.is_accepted(block.id)
+        assert False, "Block survived reset"
+    except ConsensusError:
+        pass
+
+    # The same IDs can be added again and decided under the new beta
+    engine.add_block(block)
+    for i in range(3):
+        engine.process_vote(Vote(_VIDS[i], block.id, False))
+    assert engine.is_accepted(block.id)
+    engine.flush_votes()  # Errors from before the reset were discarded
+
+    print("  ✅ Reset clears state and the engine is reusable")
     return True
 
 
@@ -304,20 +344,15 @@ def test_concurrent_consensus_operations():
     """Test thread safety of consensus operations"""
     print("\n=== CONCURRENCY: Thread-Safe Operations ===")
 
-    config = ConsensusConfig(
-        k=20,
-        alpha_preference=12,
-        alpha_confidence=15,
-        beta=10,
-        engine_type=EngineType.DAG  # DAG handles concurrency well
-    )
+    config = ConsensusConfig(k=20, alpha=12, beta=10)
     engine = ConsensusEngine(config)
 
     # Add initial blocks
     blocks = []
     parent = b'\x00' * 32
+    now = int(time.time())
     for i in range(10):
-        block = Block(bytes([i]) * 32, parent, i, int(time.time()))
+        block = Block(_VIDS[i], parent, i, now)
         blocks.append(block)
         engine.add_block(block)
         parent = block.id
@@ -327,20 +362,21 @@ def test_concurrent_consensus_operations():
     def voter_thread(thread_id, num_votes):
         """Simulate a validator voting"""
         try:
-            validator_id = bytes([thread_id]) * 32
+            validator_id = _VIDS[thread_id]
             for i in range(num_votes):
                 block_id = blocks[i % len(blocks)].id
                 vote = Vote(validator_id, block_id, i % 2 == 0)
-                engine.process_vote(vote)
+                # Queue only; the engine's consumer thread applies votes in batches
+                engine.submit_vote_nowait(vote)
         except Exception as e:
             errors.append(e)
 
     def poller_thread(thread_id, num_polls):
         """Simulate polling"""
         try:
-            validators = [bytes([i]) * 32 for i in range(thread_id, thread_id + 5)]
+            validators = _id_rows(b"".join(_VIDS[i] for i in range(thread_id, thread_id + 5)))
             for _ in range(num_polls):
-                engine.poll(validators)
+                engine.poll_view(validators)
         except Exception as e:
             errors.append(e)
 
@@ -359,9 +395,13 @@ def test_concurrent_consensus_operations():
         threads.append(t)
         t.start()
 
-    # Wait for all threads
+    # Wait for all threads, then for the queued votes to be applied
     for t in threads:
         t.join()
+    try:
+        engine.flush_votes()
+    except Exception as e:
+        errors.append(e)
 
     # Check results
     stats = engine.get_stats()
@@ -391,6 +431,7 @@ def main():
         test_dag_consensus_parallelism,
         test_pq_consensus_quantum_resistance,
         test_consensus_safety_and_liveness,
+        test_engine_reset,
         test_concurrent_consensus_operations,
     ]
 
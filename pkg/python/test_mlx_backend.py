@@ -2,11 +2,13 @@
 # Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
 # See the file LICENSE for licensing terms.
 
+import os
 import pytest
 import random
 import time
 import numpy as np
 import mlx.core as mx
+import mlx.nn as nn
 from lux_consensus.mlx_backend import (
     MLXConsensusBackend,
     MLXConsensusModel,
@@ -16,10 +18,18 @@ from lux_consensus.mlx_backend import (
 
 def generate_vote():
     """Generate random vote for testing"""
-    voter_id = bytes([random.randint(0, 255) for _ in range(32)])
-    block_id = bytes([random.randint(0, 255) for _ in range(32)])
-    is_preference = random.choice([True, False])
-    return (voter_id, block_id, is_preference)
+    return (os.urandom(32), os.urandom(32), random.choice([True, False]))
+
+
+def generate_votes(n, seed=None):
+    """Generate n random votes from one vectorised RNG draw"""
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, 256, size=(n, 64), dtype=np.uint8).tobytes()
+    prefs = rng.integers(0, 2, size=n).astype(bool).tolist()
+    return [
+        (ids[i * 64:i * 64 + 32], ids[i * 64 + 32:(i + 1) * 64], prefs[i])
+        for i in range(n)
+    ]
 
 
 def test_mlx_model_initialization():
@@ -72,7 +82,7 @@ def test_mlx_vote_processing():
     backend = MLXConsensusBackend(device_type="cpu", batch_size=10)
     
     # Generate test votes
-    votes = [generate_vote() for _ in range(25)]
+    votes = generate_votes(25)
     
     # Process votes
     processed_count = backend.process_votes_batch(votes)
@@ -93,7 +103,7 @@ def test_mlx_block_validation():
     backend = MLXConsensusBackend(device_type="cpu")
     
     # Generate test block IDs
-    block_ids = [bytes([random.randint(0, 255) for _ in range(32)]) for _ in range(10)]
+    block_ids = [os.urandom(32) for _ in range(10)]
     
     # Validate blocks
     results = backend.validate_blocks_batch(block_ids)
@@ -167,7 +177,7 @@ def test_mlx_performance_benchmark():
     batch_sizes = [10, 100, 500]
     
     for batch_size in batch_sizes:
-        votes = [generate_vote() for _ in range(batch_size)]
+        votes = generate_votes(batch_size)
         
         # Benchmark
         start = time.perf_counter()
@@ -206,7 +216,7 @@ def test_mlx_cache_management():
     backend = MLXConsensusBackend(device_type="cpu", cache_size=100)
     
     # Test cache operations
-    block_id = bytes([random.randint(0, 255) for _ in range(32)])
+    block_id = os.urandom(32)
     
     # Add to cache
     backend.block_cache[block_id] = {"test": "data"}
@@ -229,8 +239,8 @@ def test_mlx_vote_buffer_management():
     backend = MLXConsensusBackend(device_type="cpu", batch_size=5)
     
     # Test add_vote method
-    voter_id = bytes([random.randint(0, 255) for _ in range(32)])
-    block_id = bytes([random.randint(0, 255) for _ in range(32)])
+    voter_id = os.urandom(32)
+    block_id = os.urandom(32)
     
     backend.add_vote(voter_id, block_id, True)
     assert len(backend.vote_buffer) == 1
@@ -238,8 +248,8 @@ def test_mlx_vote_buffer_management():
     
     # Test auto-flush at batch size
     for i in range(4):  # Add 4 more votes to reach batch size of 5
-        voter_id = bytes([random.randint(0, 255) for _ in range(32)])
-        block_id = bytes([random.randint(0, 255) for _ in range(32)])
+        voter_id = os.urandom(32)
+        block_id = os.urandom(32)
         backend.add_vote(voter_id, block_id, True)
     
     # Buffer should be empty after auto-flush
@@ -262,7 +272,7 @@ def test_mlx_preprocessing():
     backend = MLXConsensusBackend(device_type="cpu")
     
     # Generate test votes
-    votes = [generate_vote() for _ in range(10)]
+    votes = generate_votes(10)
     
     # Test preprocessing
     processed_array = backend.preprocess_votes(votes)
@@ -270,6 +280,7 @@ def test_mlx_preprocessing():
     # Verify output shape and type
     assert processed_array.shape[0] == len(votes)
     assert processed_array.shape[1] == 64  # 32 + 32 bytes
+    assert processed_array.dtype == mx.uint8  # Raw bytes, normalised by the model
     print(f"✅ Preprocessing output shape: {processed_array.shape}")
     
     # Test with empty votes
@@ -296,6 +307,10 @@ def test_mlx_model_forward_pass():
     assert output.shape[1] == 1
     print(f"✅ Model forward pass output shape: {output.shape}")
 
+    # Raw uint8 vote bytes are accepted directly
+    byte_input = mx.array(np.random.randint(0, 256, size=(10, 64), dtype=np.uint8))
+    assert model(byte_input).shape == (10, 1)
+
 
 def test_mlx_block_validation_edge_cases():
     """Test MLX block validation edge cases"""
@@ -309,14 +324,15 @@ def test_mlx_block_validation_edge_cases():
     print("✅ Empty block validation handled")
     
     # Test single block
-    block_id = bytes([random.randint(0, 255) for _ in range(32)])
+    block_id = os.urandom(32)
     single_result = backend.validate_blocks_batch([block_id])
     assert len(single_result) == 1
     assert isinstance(single_result[0], bool)
     print("✅ Single block validation working")
     
-    # Test large batch
-    large_batch = [bytes([random.randint(0, 255) for _ in range(32)]) for _ in range(1000)]
+    # Test large batch: draw all 1000 IDs in one call, then slice 32-byte views
+    ids = np.random.default_rng(1000).bytes(1000 * 32)
+    large_batch = [ids[i * 32:(i + 1) * 32] for i in range(1000)]
     large_results = backend.validate_blocks_batch(large_batch)
     assert len(large_results) == len(large_batch)
     print("✅ Large batch validation working")
@@ -349,6 +365,20 @@ def test_mlx_adaptive_processor_detailed():
     print("✅ Final flush completed")
 
 
+def test_mlx_adaptive_processor_large_batch_size():
+    """Test a batch size above MAX_BATCH_SIZE grows the vote buffer"""
+    backend = MLXConsensusBackend(device_type="cpu", batch_size=10)
+    processor = AdaptiveMLXBatchProcessor(backend)
+    processor.optimal_batch_size = 2 * AdaptiveMLXBatchProcessor.MAX_BATCH_SIZE + 1
+
+    for vote in generate_votes(processor.optimal_batch_size - 1, seed=7):
+        processor.add_vote(*vote)
+    assert processor.get_throughput() == 0, "Flushed before the batch was full"
+
+    processor.add_vote(*generate_vote())
+    assert processor.get_throughput() > 0, "Full batch was not flushed"
+
+
 def test_mlx_quantization():
     """Test MLX quantization settings"""
     print("=== Test: MLX Quantization ===")
@@ -356,11 +386,13 @@ def test_mlx_quantization():
     # Test with quantization enabled
     backend_quantized = MLXConsensusBackend(device_type="cpu", enable_quantization=True)
     assert backend_quantized.enable_quantization
+    assert isinstance(backend_quantized.model.layer1, nn.QuantizedLinear)
     print("✅ Quantization enabled backend created")
     
     # Test with quantization disabled
     backend_no_quant = MLXConsensusBackend(device_type="cpu", enable_quantization=False)
     assert not backend_no_quant.enable_quantization
+    assert not isinstance(backend_no_quant.model.layer1, nn.QuantizedLinear)
     print("✅ Quantization disabled backend created")
 
 
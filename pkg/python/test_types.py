@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
+# See the file LICENSE for licensing terms.
+
+"""Tests for the wire protocol types in lux_consensus.types"""
+
+import json
+
+import numpy as np
+import pytest
+
+from lux_consensus.types import (
+    Candidate, CandidateMeta, Certificate, PolicyID, Validator, ValidatorSet, Vote,
+    VoteBatch, SIG_ED25519,
+    agent_mesh_config, blockchain_config, rollup_config, single_node_config,
+    compute_candidate_id, compute_candidate_ids_batch,
+    _CANDIDATE_ID_CACHE_MAX_PAYLOAD, _candidate_id_lru,
+)
+
+
+def test_candidate_verify_after_mutation():
+    """A cached verify() result is dropped when id, domain or payload changes"""
+    candidate = Candidate.new(b"test", b"payload", 1)
+    assert candidate.verify()
+
+    candidate.payload = b"tampered"
+    assert not candidate.verify()
+    candidate.payload = b"payload"
+    assert candidate.verify()
+
+    candidate.domain = b"other"
+    assert not candidate.verify()
+    candidate.domain = b"test"
+    assert candidate.verify()
+
+    candidate.id = b"\x00" * 32
+    assert not candidate.verify()
+
+
+def test_candidate_equality_compares_all_fields():
+    a = Candidate.new(b"test", b"payload", 1, now_ms=5)
+    b = Candidate.new(b"test", b"payload", 1, now_ms=5)
+    assert a == b
+    b.height = 2
+    assert a != b and a.id == b.id
+    with pytest.raises(TypeError):
+        hash(a)
+
+
+def test_candidate_id_accepts_bytes_like_domain():
+    expected = compute_candidate_id(b"test", b"payload")
+    assert compute_candidate_id(bytearray(b"test"), b"payload") == expected
+    assert compute_candidate_id(memoryview(b"test"), b"payload") == expected
+    assert bytes(compute_candidate_ids_batch([bytearray(b"test")], [b"payload"])[0]) == expected
+
+
+@pytest.mark.parametrize("factory", [single_node_config, agent_mesh_config, blockchain_config, rollup_config])
+def test_config_factories_accept_bytes_like_domain(factory):
+    config = factory(bytearray(b"net"))
+    assert config.domain == b"net" and type(config.domain) is bytes
+    assert factory(memoryview(b"net")) is config is factory(b"net")
+
+
+def test_candidate_new_bytes_like_and_large_payload():
+    candidate = Candidate.new(bytearray(b"test"), bytearray(b"payload"), 1)
+    assert candidate.id == compute_candidate_id(b"test", b"payload")
+    assert candidate.domain == b"test" and type(candidate.domain) is bytes
+
+    # Payloads above the cache limit are hashed directly, not retained
+    _candidate_id_lru.cache_clear()
+    large = bytes(_CANDIDATE_ID_CACHE_MAX_PAYLOAD + 1)
+    candidate = Candidate.new(b"test", large, 2)
+    assert candidate.verify()
+    assert _candidate_id_lru.cache_info().currsize == 0
+
+
+def test_wire_round_trip():
+    meta = CandidateMeta(proposer_id=b"p" * 32, timestamp_ms=123, chain_id=b"c", extra=None)
+    candidate = Candidate.new(b"test", b"payload", 7, parent_id=b"\x01" * 32)
+    candidate.meta = meta
+    candidate.da_ref = "blob:1"
+    decoded = Candidate.from_wire(candidate.to_wire())
+    assert decoded.to_dict() == candidate.to_dict()
+    assert decoded.verify()
+
+    vote = Vote(b"\x02" * 32, b"\x03" * 32, round=9, preference=False,
+                signature=bytes([SIG_ED25519]) + b"s" * 64, timestamp_ms=456)
+    assert Vote.from_wire(vote.to_wire()) == vote
+    unsigned = Vote(b"\x02" * 32, b"\x03" * 32, timestamp_ms=1)
+    assert Vote.from_wire(unsigned.to_wire()) == unsigned
+
+    cert = Certificate(b"\x04" * 32, 7, PolicyID.QUORUM, b"proof", signers=None, timestamp_ms=789)
+    assert Certificate.from_wire(cert.to_wire()) == cert
+
+
+def test_to_json_matches_stdlib_compact_output():
+    # Every JSON backend must emit the same bytes, including non-ASCII text
+    candidate = Candidate.new(b"test", b"payload", 1)
+    candidate.da_ref = "blob:\u00e9\u4e16"
+    expected = json.dumps(candidate.to_dict(), separators=(",", ":"), ensure_ascii=False)
+    assert candidate.to_json() == expected
+    assert Candidate.from_json(expected).to_dict() == candidate.to_dict()
+
+
+@pytest.mark.parametrize("make", [
+    lambda: Candidate(b"short", b"\x00" * 32, 1, b"d", b"p"),
+    lambda: Candidate(b"\x00" * 32, b"\x00" * 33, 1, b"d", b"p"),
+    lambda: Vote(b"\x00" * 31, b"\x00" * 32),
+    lambda: Vote(b"\x00" * 32, b""),
+    lambda: Certificate(b"\x00" * 40, 1, PolicyID.NONE, b""),
+])
+def test_to_wire_rejects_bad_id_width(make):
+    with pytest.raises(ValueError):
+        make().to_wire()
+
+
+@pytest.mark.parametrize("make", [
+    lambda: Vote(b"\x00" * 32, b"\x01" * 32, round=-1),
+    lambda: Vote(b"\x00" * 32, b"\x01" * 32, timestamp_ms=2 ** 64),
+    lambda: Candidate(b"\x00" * 32, b"\x00" * 32, -1, b"d", b"p"),
+    lambda: Certificate(b"\x00" * 32, -1, PolicyID.NONE, b""),
+    lambda: Certificate(b"\x00" * 32, 1, PolicyID.NONE, b"", timestamp_ms=2 ** 64),
+])
+def test_to_wire_rejects_out_of_range_fields(make):
+    with pytest.raises(ValueError):
+        make().to_wire()
+
+
+@pytest.mark.parametrize("cls, obj", [
+    (Candidate, Candidate.new(b"test", b"payload", 1)),
+    (Vote, Vote(b"\x00" * 32, b"\x01" * 32)),
+    (Certificate, Certificate(b"\x00" * 32, 1, PolicyID.NONE, b"proof")),
+])
+def test_from_wire_rejects_truncated_input(cls, obj):
+    wire = obj.to_wire()
+    for cut in (0, 10, len(wire) - 1):
+        with pytest.raises(ValueError):
+            cls.from_wire(wire[:cut])
+
+
+def test_validator_set_arrays_stay_in_sync():
+    validators = [Validator(bytes([i]) * 32, weight=i + 1) for i in range(4)]
+    vs = ValidatorSet(epoch=1, validators=validators)
+    assert vs.total_weight == 10
+    assert vs.weights.tolist() == [1, 2, 3, 4]
+    assert bytes(vs.ids_matrix[2]) == bytes([2]) * 32
+    assert vs.contains(bytes([3]) * 32) and not vs.contains(b"\x09" * 32)
+    assert not vs.contains(b"\x01" * 20)
+
+    # The list stays mutable and the arrays follow it
+    vs.validators.append(Validator(b"\x09" * 32, weight=5))
+    assert vs.contains(b"\x09" * 32) and vs.weights.tolist() == [1, 2, 3, 4, 5]
+    del vs.validators[0]
+    assert not vs.contains(b"\x00" * 32) and len(vs.ids_matrix) == 4
+    vs.validators = [Validator(b"\x07" * 32)]
+    assert vs.contains(b"\x07" * 32) and not vs.contains(b"\x09" * 32)
+
+    # Editing a Validator in place needs refresh()
+    vs.validators[0].weight = 8
+    vs.refresh()
+    assert vs.weights.tolist() == [8]
+    with pytest.raises(ValueError):
+        vs.weights[0] = 100
+
+    assert ValidatorSet.from_dict(vs.to_dict()) == vs
+    assert ValidatorSet(epoch=2, validators=[]).total_weight == 0
+    with pytest.raises(TypeError):
+        hash(vs)
+
+
+def test_validator_set_mixed_id_lengths():
+    vs = ValidatorSet(epoch=1, validators=[Validator(b"\x01" * 32, weight=2), Validator(b"\x02" * 20)])
+    assert vs.ids_matrix is None and vs.total_weight == 3
+    assert vs.contains(b"\x02" * 20) and vs.contains(b"\x01" * 32)
+    assert not vs.contains(b"\x02" * 32)
+
+
+def test_vote_batch_tally_matches_per_vote_tally():
+    rng = np.random.default_rng(11)
+    candidates = [bytes([i]) * 32 for i in range(5)]
+    votes = [Vote(candidates[rng.integers(5)], bytes(rng.integers(0, 256, 32, dtype=np.uint8)),
+                  preference=bool(rng.integers(2)), timestamp_ms=0)
+             for _ in range(200)]
+    weights = rng.integers(1, 1000, len(votes)).tolist()
+
+    expected = {}
+    for vote, weight in zip(votes, weights):
+        if vote.preference:
+            expected[vote.candidate_id] = expected.get(vote.candidate_id, 0) + weight
+    assert VoteBatch.from_votes(votes, weights).tally() == expected
+
+    unweighted = {}
+    for vote in votes:
+        if vote.preference:
+            unweighted[vote.candidate_id] = unweighted.get(vote.candidate_id, 0) + 1
+    assert VoteBatch.from_votes(votes).tally() == unweighted
+
+
+def test_vote_batch_tally_edge_cases():
+    empty = VoteBatch.from_votes([])
+    assert len(empty) == 0 and empty.tally() == {}
+
+    rejecting = [Vote(b"\x01" * 32, b"\x02" * 32, preference=False)]
+    assert VoteBatch.from_votes(rejecting, [5]).tally() == {}
+
+
+def test_candidate_meta_presence_round_trip():
+    bare = Candidate(b"\x01" * 32, b"\x00" * 32, 1, b"d", b"p")
+    assert Candidate.from_wire(bare.to_wire()).meta is None
+
+    # An all-default meta with timestamp 0 is still present after decoding
+    empty = Candidate(b"\x01" * 32, b"\x00" * 32, 1, b"d", b"p", meta=CandidateMeta(timestamp_ms=0))
+    decoded = Candidate.from_wire(empty.to_wire())
+    assert decoded.meta == CandidateMeta(timestamp_ms=0)
+    assert Candidate.from_dict(empty.to_dict()).meta == decoded.meta
+
+    # to_dict writes an explicit null; dicts without the key get a default meta
+    assert Candidate.from_dict(bare.to_dict()).meta is None
+    legacy = bare.to_dict()
+    del legacy["meta"]
+    assert isinstance(Candidate.from_dict(legacy).meta, CandidateMeta)
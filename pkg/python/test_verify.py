@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
+# See the file LICENSE for licensing terms.
+
+"""Tests for batch vote signature verification"""
+
+import os
+
+import pytest
+
+nacl_signing = pytest.importorskip("nacl.signing")
+
+from lux_consensus import verify
+from lux_consensus.types import Vote, SIG_ED25519
+from lux_consensus.verify import verify_votes_batch
+
+
+def signed_votes(n):
+    """n Ed25519-signed votes and their voter_id -> public key map"""
+    votes, pubkeys = [], {}
+    for _ in range(n):
+        key = nacl_signing.SigningKey.generate()
+        vote = Vote(candidate_id=os.urandom(32), voter_id=os.urandom(32), round=3)
+        sig = key.sign(vote.signing_bytes()).signature
+        vote.signature = bytes([SIG_ED25519]) + sig
+        votes.append(vote)
+        pubkeys[vote.voter_id] = bytes(key.verify_key)
+    return votes, pubkeys
+
+
+def test_valid_batch():
+    votes, pubkeys = signed_votes(16)
+    assert verify_votes_batch(votes, pubkeys) == [True] * 16
+
+
+def test_one_bad_signature():
+    votes, pubkeys = signed_votes(16)
+    sig = bytearray(votes[5].signature)
+    sig[-1] ^= 0x01
+    votes[5].signature = bytes(sig)
+    votes[9].preference = not votes[9].preference  # Signed field changed
+
+    results = verify_votes_batch(votes, pubkeys)
+    assert results == [i not in (5, 9) for i in range(16)]
+
+
+def test_unsigned_and_unknown_voters():
+    votes, pubkeys = signed_votes(3)
+    votes[0].signature = None
+    del pubkeys[votes[1].voter_id]
+    assert verify_votes_batch(votes, pubkeys) == [False, False, True]
+
+
+def test_missing_backend_raises(monkeypatch):
+    votes, pubkeys = signed_votes(2)
+    monkeypatch.setattr(verify, "VerifyKey", None)
+    with pytest.raises(ImportError):
+        verify_votes_batch(votes, pubkeys)
+    # Batches without that scheme do not need the backend
+    assert verify_votes_batch([Vote(os.urandom(32), os.urandom(32))], pubkeys) == [False]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019-2025, Lux Industries Inc. All rights reserved.
+# See the file LICENSE for licensing terms.
+
+"""Tests for aggregate BLS vote verification"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+blspy = pytest.importorskip("blspy")
+
+from lux_consensus import verify
+from lux_consensus.types import Vote, SIG_BLS
+from lux_consensus.verify import verify_votes_batch
+
+PopSchemeMPL = blspy.PopSchemeMPL
+
+
+def signed_votes(n):
+    """n BLS-signed votes and their voter_id -> public key map"""
+    votes, pubkeys = [], {}
+    for _ in range(n):
+        sk = PopSchemeMPL.key_gen(os.urandom(32))
+        vote = Vote(candidate_id=os.urandom(32), voter_id=os.urandom(32), round=3)
+        vote.signature = bytes([SIG_BLS]) + bytes(PopSchemeMPL.sign(sk, vote.signing_bytes()))
+        votes.append(vote)
+        pubkeys[vote.voter_id] = bytes(sk.get_g1())
+    return votes, pubkeys
+
+
+def test_valid_batch_uses_one_aggregate_check(monkeypatch):
+    votes, pubkeys = signed_votes(8)
+
+    def no_per_vote_check(*args):
+        raise AssertionError("per-vote check ran for a valid batch")
+
+    monkeypatch.setattr(verify, "PopSchemeMPL", SimpleNamespace(
+        aggregate=PopSchemeMPL.aggregate,
+        aggregate_verify=PopSchemeMPL.aggregate_verify,
+        verify=no_per_vote_check,
+    ))
+    assert verify_votes_batch(votes, pubkeys) == [True] * 8
+
+
+def test_bad_signature_falls_back_to_per_vote():
+    votes, pubkeys = signed_votes(8)
+    # Signed by the wrong key, and a signed field changed after signing
+    other = PopSchemeMPL.key_gen(os.urandom(32))
+    votes[2].signature = bytes([SIG_BLS]) + bytes(PopSchemeMPL.sign(other, votes[2].signing_bytes()))
+    votes[6].preference = not votes[6].preference
+    assert verify_votes_batch(votes, pubkeys) == [i not in (2, 6) for i in range(8)]
+
+
+def test_unknown_voter_and_undecodable_signature():
+    votes, pubkeys = signed_votes(3)
+    del pubkeys[votes[0].voter_id]
+    votes[1].signature = bytes([SIG_BLS]) + b"\x00" * 10
+    assert verify_votes_batch(votes, pubkeys) == [False, False, True]
+
+
+def test_missing_backend_raises(monkeypatch):
+    votes, pubkeys = signed_votes(1)
+    monkeypatch.setattr(verify, "PopSchemeMPL", None)
+    with pytest.raises(ImportError):
+        verify_votes_batch(votes, pubkeys)